@@ -13,11 +13,11 @@ Ejecutar:
 """
 import argparse
 import sys
+from dataclasses import replace
 from typing import List, Optional
 
 from src.engine import TriominoGame, MatchSimulator
-from src.visualization import visualize_game, GameRenderer
-from src.config import load_config
+from src.config import load_sim_config
 from src.ai.strategies import get_strategy, AIStrategy
 
 
@@ -36,6 +36,7 @@ def run_visualized_simulation(num_matches: int = 5,
         seed: Random seed for reproducibility
     """
     import matplotlib.pyplot as plt
+    from src.visualization import GameRenderer
     
     print("\n" + "🎮" * 20)
     print("   TRIOMINÓ - WAR GAMES EDITION")
@@ -202,45 +203,38 @@ Examples:
     args = parser.parse_args()
     
     try:
-        config = load_config(args.config)
-        simulation = config.get("simulation", {})
-        logging_cfg = config.get("logging", {})
-        players = config.get("players", [])
-        if not players:
-            players = [
-                {"name": "CPU-Alpha", "strategy": "greedy"},
-                {"name": "CPU-Beta", "strategy": "greedy"}
-            ]
-        player_names = [p.get("name", f"Player {i+1}") for i, p in enumerate(players)]
-        strategy_names = [p.get("strategy", "greedy") for p in players]
-        strategies = [get_strategy(name) for name in strategy_names]
-
-        matches = args.matches if args.matches is not None else simulation.get("matches", 5)
-        seed = args.seed if args.seed is not None else simulation.get("seed")
-        delay = args.delay if args.delay is not None else simulation.get("delay", 0.3)
-        fast = args.fast if args.fast is not None else simulation.get("fast", False)
-        target_score = config.get("game", {}).get("target_score", 400)
-        log_enabled = logging_cfg.get("enabled", False)
-        log_dir = logging_cfg.get("run_dir", "runs")
+        cfg = load_sim_config(args.config)
+        overrides = {
+            key: value
+            for key, value in (
+                ("matches", args.matches),
+                ("seed", args.seed),
+                ("delay", args.delay),
+                ("fast", args.fast),
+            )
+            if value is not None
+        }
+        if overrides:
+            cfg = replace(cfg, **overrides)
 
-        if fast:
+        if cfg.fast:
             run_fast_simulation(
-                num_matches=matches,
-                seed=seed,
-                player_names=player_names,
-                strategy_names=strategy_names,
-                target_score=target_score,
-                log_enabled=log_enabled,
-                log_dir=log_dir
+                num_matches=cfg.matches,
+                seed=cfg.seed,
+                player_names=cfg.player_names,
+                strategy_names=cfg.strategy_names,
+                target_score=cfg.target_score,
+                log_enabled=cfg.log_enabled,
+                log_dir=cfg.log_dir
             )
         else:
             run_visualized_simulation(
-                num_matches=matches,
-                animation_delay=delay,
-                seed=seed,
-                player_names=player_names,
-                strategies=strategies,
-                target_score=target_score
+                num_matches=cfg.matches,
+                animation_delay=cfg.delay,
+                seed=cfg.seed,
+                player_names=cfg.player_names,
+                strategies=[get_strategy(name) for name in cfg.strategy_names],
+                target_score=cfg.target_score
             )
     except KeyboardInterrupt:
         print("\n\n👋 Simulation cancelled by user.")
@@ -6,21 +6,33 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections import defaultdict
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
+
+# Prefer a C JSON parser when one is installed; all of them accept bytes.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
+# Stats plots don't need print resolution; fast zlib keeps PNG encoding cheap.
+SAVE_OPTIONS = {"dpi": 100, "pil_kwargs": {"compress_level": 1}}
 
 
 def load_runs(input_dir: Path) -> List[Dict]:
-    files = sorted(input_dir.glob("run-*.json"))
     runs = []
-    for path in files:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            data["_path"] = path
-            runs.append(data)
+    for path in sorted(input_dir.glob("run-*.json")):
+        data = json_loads(path.read_bytes())
+        data["_path"] = path
+        runs.append(data)
     return runs
 
 
@@ -34,60 +46,80 @@ def plot_run(run: Dict, output_dir: Path, show: bool = False) -> None:
     if not results:
         return
 
-    wins = defaultdict(int)
-    rounds = []
-    scores_by_player = {p: [] for p in players}
-
-    for match in results:
-        winner = match.get("winner")
-        if winner:
-            wins[winner] += 1
-        rounds.append(match.get("rounds_played", 0))
-        final_scores = match.get("final_scores", {})
-        for p in players:
-            scores_by_player[p].append(final_scores.get(p, 0))
+    # One column per metric; matches are rows.
+    winners = np.array([match.get("winner") or "" for match in results])
+    rounds = np.array([match.get("rounds_played", 0) for match in results])
+    scores = np.array(
+        [[match.get("final_scores", {}).get(p, 0) for p in players] for match in results]
+    ).reshape(len(results), len(players))
+    match_ids = np.arange(1, len(results) + 1)
+
+    # Win counts, keeping players in order of their first win
+    unique, first_seen, counts = np.unique(winners, return_index=True, return_counts=True)
+    order = np.argsort(first_seen)
+    names, values = unique[order], counts[order]
+    has_name = names != ""
+    names, values = names[has_name], values[has_name]
+
+    # One Figure serves all three plots when saving; the axes are cleared in
+    # between. Closing a shown window unregisters its Figure from pyplot, so
+    # with show each plot gets its own Figure.
+    fig, ax = plt.subplots(figsize=(6, 4))
+
+    def next_axes():
+        if show:
+            return plt.subplots(figsize=(6, 4))
+        ax.clear()
+        return fig, ax
 
     # Plot wins
-    plt.figure(figsize=(6, 4))
-    names = list(wins.keys())
-    values = [wins[n] for n in names]
-    plt.bar(names, values, color="#1e88e5")
-    plt.title("Wins per player")
-    plt.ylabel("Wins")
-    plt.tight_layout()
+    ax.bar(names, values, color="#1e88e5")
+    ax.set_title("Wins per player")
+    ax.set_ylabel("Wins")
+    fig.tight_layout()
     wins_path = output_dir / "wins.png"
-    plt.savefig(wins_path, dpi=150)
+    fig.savefig(wins_path, **SAVE_OPTIONS)
     if show:
         plt.show()
-    plt.close()
 
     # Plot rounds per match
-    plt.figure(figsize=(6, 4))
-    plt.plot(range(1, len(rounds) + 1), rounds, marker="o", color="#43a047")
-    plt.title("Rounds per match")
-    plt.xlabel("Match")
-    plt.ylabel("Rounds")
-    plt.tight_layout()
+    fig, ax = next_axes()
+    ax.plot(match_ids, rounds, marker="o", color="#43a047")
+    ax.set_title("Rounds per match")
+    ax.set_xlabel("Match")
+    ax.set_ylabel("Rounds")
+    fig.tight_layout()
     rounds_path = output_dir / "rounds.png"
-    plt.savefig(rounds_path, dpi=150)
+    fig.savefig(rounds_path, **SAVE_OPTIONS)
     if show:
         plt.show()
-    plt.close()
 
     # Plot scores per match
-    plt.figure(figsize=(6, 4))
-    for p, scores in scores_by_player.items():
-        plt.plot(range(1, len(scores) + 1), scores, marker="o", label=p)
-    plt.title("Final scores per match")
-    plt.xlabel("Match")
-    plt.ylabel("Score")
-    plt.legend()
-    plt.tight_layout()
+    fig, ax = next_axes()
+    for p, player_scores in zip(players, scores.T):
+        ax.plot(match_ids, player_scores, marker="o", label=p)
+    ax.set_title("Final scores per match")
+    ax.set_xlabel("Match")
+    ax.set_ylabel("Score")
+    ax.legend()
+    fig.tight_layout()
     scores_path = output_dir / "scores.png"
-    plt.savefig(scores_path, dpi=150)
+    fig.savefig(scores_path, **SAVE_OPTIONS)
     if show:
         plt.show()
-    plt.close()
+    plt.close(fig)
+
+
+def _init_worker() -> None:
+    # Workers only write files, so keep them off any GUI backend
+    plt.switch_backend("Agg")
+
+
+def _plot_one(task: Tuple[Dict, Path]) -> Path:
+    run, out_dir = task
+    ensure_dir(out_dir)
+    plot_run(run, out_dir)
+    return out_dir
 
 
 def main() -> None:
@@ -106,12 +138,20 @@ def main() -> None:
         print(f"No run-*.json files found in {input_dir}")
         return
 
-    for run in runs:
-        stem = run["_path"].stem
-        out_dir = output_base / stem
-        ensure_dir(out_dir)
-        plot_run(run, out_dir, show=args.show)
-        print(f"Saved plots to {out_dir}")
+    tasks = [(run, output_base / run["_path"].stem) for run in runs]
+
+    # Interactive windows need the main process; otherwise fan runs out to workers
+    if args.show or len(tasks) == 1:
+        for run, out_dir in tasks:
+            ensure_dir(out_dir)
+            plot_run(run, out_dir, show=args.show)
+            print(f"Saved plots to {out_dir}")
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1),
+                             initializer=_init_worker) as executor:
+        for out_dir in executor.map(_plot_one, tasks):
+            print(f"Saved plots to {out_dir}")
 
 
 if __name__ == "__main__":
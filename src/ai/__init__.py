@@ -3,10 +3,11 @@
 
 from .strategies import (
     AIStrategy, GreedyStrategy, BalancedStrategy, 
-    DefensiveStrategy, RandomStrategy, ScoredMove, get_strategy
+    DefensiveStrategy, RandomStrategy, MinimaxStrategy, ScoredMove, get_strategy
 )
 
 __all__ = [
     'AIStrategy', 'GreedyStrategy', 'BalancedStrategy',
-    'DefensiveStrategy', 'RandomStrategy', 'ScoredMove', 'get_strategy',
+    'DefensiveStrategy', 'RandomStrategy', 'MinimaxStrategy', 'ScoredMove',
+    'get_strategy',
 ]
@@ -4,36 +4,35 @@ AI Strategies for Computer Players
 Different strategies for playing Triominó automatically.
 """
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+import random
 
 from src.models import Triomino, Player, GameBoard, ValidPlacement
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredMove:
     """A potential move with its calculated score."""
     tile: Triomino
     placement: ValidPlacement
     base_score: int
     bonus_score: int
+    total_score: int = field(init=False)
     
-    @property
-    def total_score(self) -> int:
-        return self.base_score + self.bonus_score
+    def __post_init__(self):
+        self.total_score = self.base_score + self.bonus_score
     
     def __repr__(self) -> str:
         bonus = f" +{self.bonus_score}" if self.bonus_score else ""
         return f"Move({self.tile} → ({self.placement.row},{self.placement.col}){bonus})"
 
 
-class AIStrategy(ABC):
-    """Base class for AI strategies."""
+class AIStrategy:
+    """Base class for AI strategies; subclasses implement choose_move."""
     
     name: str = "Base Strategy"
     
-    @abstractmethod
     def choose_move(self, player: Player, board: GameBoard) -> Optional[ScoredMove]:
         """
         Choose the best move for the player.
@@ -45,26 +44,51 @@ class AIStrategy(ABC):
         Returns:
             ScoredMove or None if no valid moves
         """
-        pass
+        raise NotImplementedError
     
     def get_all_valid_moves(self, player: Player, board: GameBoard) -> List[ScoredMove]:
         """Get all valid moves for a player with scores."""
         moves = []
+        append = moves.append
+        find_valid = board.find_valid_placements
         
         for tile in player.hand:
-            placements = board.find_valid_placements(tile)
-            for placement in placements:
-                bonus = (placement.hexagon_count * 50) + (placement.bridge_count * 40)
-                
-                moves.append(ScoredMove(
+            base_score = tile.sum_value
+            for placement in find_valid(tile):
+                append(ScoredMove(
                     tile=tile,
                     placement=placement,
-                    base_score=tile.sum_value,
-                    bonus_score=bonus
+                    base_score=base_score,
+                    bonus_score=placement.bonus_points
                 ))
         
         return moves
 
+    def best_valid_move(self, player: Player, board: GameBoard,
+                        key: Callable[[Triomino, ValidPlacement], Any]) -> Optional[ScoredMove]:
+        """
+        Get the move with the highest key without scoring every candidate.
+
+        Ties go to the first move in hand/placement order, as with max().
+        Only the winning move is wrapped in a ScoredMove.
+        """
+        best_tile = best_placement = best_key = None
+        find_valid = board.find_valid_placements
+        for tile in player.hand:
+            for placement in find_valid(tile):
+                k = key(tile, placement)
+                if best_placement is None or k > best_key:
+                    best_tile, best_placement, best_key = tile, placement, k
+        
+        if best_placement is None:
+            return None
+        return ScoredMove(
+            tile=best_tile,
+            placement=best_placement,
+            base_score=best_tile.sum_value,
+            bonus_score=best_placement.bonus_points
+        )
+
 
 class GreedyStrategy(AIStrategy):
     """
@@ -78,13 +102,26 @@ class GreedyStrategy(AIStrategy):
     name = "Greedy"
     
     def choose_move(self, player: Player, board: GameBoard) -> Optional[ScoredMove]:
-        moves = self.get_all_valid_moves(player, board)
-        if not moves:
-            return None
+        # Highest total score (first one wins ties); best_valid_move inlined
+        # since this runs for most simulated turns
+        find_valid = board.find_valid_placements
+        best_tile = best_placement = None
+        best_score = -1
+        for tile in player.hand:
+            base_score = tile.sum_value
+            for placement in find_valid(tile):
+                score = base_score + placement.bonus_points
+                if score > best_score:
+                    best_tile, best_placement, best_score = tile, placement, score
         
-        # Sort by total score descending
-        moves.sort(key=lambda m: m.total_score, reverse=True)
-        return moves[0]
+        if best_placement is None:
+            return None
+        return ScoredMove(
+            tile=best_tile,
+            placement=best_placement,
+            base_score=best_tile.sum_value,
+            bonus_score=best_placement.bonus_points
+        )
 
 
 class BalancedStrategy(AIStrategy):
@@ -97,31 +134,35 @@ class BalancedStrategy(AIStrategy):
     name = "Balanced"
     
     def choose_move(self, player: Player, board: GameBoard) -> Optional[ScoredMove]:
-        moves = self.get_all_valid_moves(player, board)
-        if not moves:
+        import numpy as np
+        candidates = [(tile, placement)
+                      for tile in player.hand
+                      for placement in board.find_valid_placements(tile)]
+        if not candidates:
             return None
         
-        # Score each move considering multiple factors
-        scored = []
-        for move in moves:
-            score = move.total_score
-            
-            # Bonus for playing tiles with extreme values (harder to match later)
-            if move.tile.sum_value >= 12:  # High value tiles
-                score += 3
-            elif move.tile.sum_value <= 3:  # Low value tiles
-                score += 2
-            
-            # Bonus for hexagon/bridge (these are valuable)
-            if move.placement.hexagon_count > 0:
-                score += 10
-            elif move.placement.bridge_count > 0:
-                score += 5
-            
-            scored.append((score, move))
+        # Score every move at once considering multiple factors
+        n = len(candidates)
+        sums = np.fromiter((t.sum_value for t, _ in candidates), dtype=np.int32, count=n)
+        bonus = np.fromiter((p.bonus_points for _, p in candidates), dtype=np.int32, count=n)
+        hexes = np.fromiter((p.hexagon_count for _, p in candidates), dtype=np.int32, count=n)
+        bridges = np.fromiter((p.bridge_count for _, p in candidates), dtype=np.int32, count=n)
+        score = sums + bonus
+        
+        # Bonus for playing tiles with extreme values (harder to match later)
+        score += np.where(sums >= 12, 3, np.where(sums <= 3, 2, 0))
+        
+        # Bonus for hexagon/bridge (these are valuable)
+        score += np.where(hexes > 0, 10, np.where(bridges > 0, 5, 0))
         
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return scored[0][1]
+        # argmax keeps the first best move, like max()
+        tile, placement = candidates[int(score.argmax())]
+        return ScoredMove(
+            tile=tile,
+            placement=placement,
+            base_score=tile.sum_value,
+            bonus_score=placement.bonus_points
+        )
 
 
 class DefensiveStrategy(AIStrategy):
@@ -134,17 +175,12 @@ class DefensiveStrategy(AIStrategy):
     name = "Defensive"
     
     def choose_move(self, player: Player, board: GameBoard) -> Optional[ScoredMove]:
-        moves = self.get_all_valid_moves(player, board)
-        if not moves:
-            return None
-        
         # For now, same as greedy but with slight preference for lower-value moves
         # to save high-value tiles for better opportunities
-        moves.sort(key=lambda m: (
-            -m.bonus_score,  # Still prioritize bonuses
-            m.base_score     # But prefer lower base scores (ascending)
+        return self.best_valid_move(player, board, key=lambda t, p: (
+            p.bonus_points,  # Still prioritize bonuses
+            -t.sum_value     # But prefer lower base scores
         ))
-        return moves[0]
 
 
 class RandomStrategy(AIStrategy):
@@ -156,12 +192,244 @@ class RandomStrategy(AIStrategy):
     
     name = "Random"
     
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng if rng is not None else random.Random()
+    
+    def set_game(self, game) -> None:
+        # Draw from the game's generator so seeded games replay exactly
+        self.rng = game.rng
+    
     def choose_move(self, player: Player, board: GameBoard) -> Optional[ScoredMove]:
-        import random
         moves = self.get_all_valid_moves(player, board)
         if not moves:
             return None
-        return random.choice(moves)
+        return self.rng.choice(moves)
+
+
+class MinimaxStrategy(AIStrategy):
+    """
+    Minimax strategy: looks ahead a few plies with alpha-beta pruning.
+    
+    Each ply is one player's move; values are point differences from the
+    point of view of the player to move (negamax). Needs the game (via
+    set_game) to see the other hands; plays greedily without it.
+    """
+    
+    name = "Minimax"
+    
+    # Approximate rule values used by the search evaluation
+    PASS_PENALTY = -10
+    ROUND_WIN_BONUS = 25
+    
+    # Transposition table entry flags: exact value, lower or upper bound
+    EXACT, LOWER, UPPER = 0, 1, 2
+    
+    def __init__(self, depth: int = 2, tt_size: int = 100_000):
+        self.depth = depth
+        self.game = None
+        # (board hash, side, hands at root) -> (depth, value, flag, best move)
+        self.tt: Dict[tuple, tuple] = {}
+        self.tt_size = tt_size
+        self._root_hands: tuple = ()
+        # Move ordering: up to two cutoff moves per depth, and cutoff counts
+        self.killers: Dict[int, tuple] = {}
+        self.history: Dict[tuple, int] = {}
+    
+    def set_game(self, game) -> None:
+        if game is not self.game:
+            # Search tables describe the previous game's positions
+            self.tt.clear()
+            self.killers.clear()
+            self.history.clear()
+        self.game = game
+    
+    def choose_move(self, player: Player, board: GameBoard) -> Optional[ScoredMove]:
+        if not self.game or self.depth < 1:
+            return GreedyStrategy().choose_move(player, board)
+        
+        players = self.game.players
+        side = next(i for i, p in enumerate(players) if p is player)
+        hands = [list(p.hand) for p in players]
+        # Hands below the root follow from the board, so the root hands plus
+        # the board hash identify a search position
+        self._root_hands = tuple(tuple(sorted(t.canonical_id for t in h)) for h in hands)
+        # Killers are position-specific; history carries over but fades
+        self.killers.clear()
+        self.history = {k: v // 2 for k, v in self.history.items() if v > 1}
+        
+        moves = self._ordered_moves(board, player.hand)
+        if not moves:
+            return None
+        
+        best = None
+        alpha, beta = float("-inf"), float("inf")
+        for points, tile, placement in moves:
+            value = self._move_value(board, hands, side, points, tile, placement,
+                                     self.depth, alpha, beta)
+            if best is None or value > alpha:
+                best = (tile, placement)
+                alpha = value
+        
+        tile, placement = best
+        return ScoredMove(
+            tile=tile,
+            placement=placement,
+            base_score=tile.sum_value,
+            bonus_score=placement.bonus_points
+        )
+    
+    def _ordered_moves(self, board: GameBoard,
+                       hand: List[Triomino]) -> List[Tuple[int, Triomino, ValidPlacement]]:
+        """Moves as (points, tile, placement), best immediate score first."""
+        moves = []
+        for tile in hand:
+            placements = board.find_valid_placements(tile)
+            for placement in placements:
+                moves.append((tile.sum_value + placement.bonus_points, tile, placement))
+        moves.sort(key=lambda m: m[0], reverse=True)
+        return moves
+    
+    def _move_value(self, board: GameBoard, hands: List[List[Triomino]], side: int,
+                    points: int, tile: Triomino, placement: ValidPlacement,
+                    depth: int, alpha: float, beta: float) -> float:
+        """Value of playing `tile` at `placement` for `side`, searched to `depth`."""
+        rest = [t for t in hands[side] if t is not tile]
+        if not rest:
+            # Emptying the hand ends the round: bonus plus the opponents' tiles
+            others = sum(t.sum_value for i, h in enumerate(hands) if i != side for t in h)
+            return points + self.ROUND_WIN_BONUS + others
+        if depth <= 1:
+            return points
+        
+        child = board.copy()
+        child.place_tile(tile, placement.row, placement.col,
+                         placement.orientation, placement.rotation)
+        
+        next_hands = list(hands)
+        next_hands[side] = rest
+        next_side = (side + 1) % len(hands)
+        return points - self._negamax(child, next_hands, next_side, depth - 1,
+                                      -beta + points, -alpha + points)
+    
+    def _negamax(self, board: GameBoard, hands: List[List[Triomino]], side: int,
+                 depth: int, alpha: float, beta: float) -> float:
+        """Best point difference `side` can reach from here (alpha-beta)."""
+        key = (board.zobrist_hash(), side, self._root_hands)
+        hint = None
+        entry = self.tt.get(key)
+        if entry is not None:
+            entry_depth, value, flag, hint = entry
+            if entry_depth >= depth:
+                if flag == self.EXACT:
+                    return value
+                if flag == self.LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+        alpha_orig = alpha
+        
+        moves = self._ordered_moves(board, hands[side])
+        if len(moves) > 1:
+            # TT best move first, then killer moves, then by cutoff history;
+            # the sort is stable, so ties keep the immediate-score order
+            killers = self.killers.get(depth, ())
+            history = self.history
+            
+            def order(m):
+                move = self._move_key(m[1], m[2])
+                return (move != hint, move not in killers,
+                        -history.get(self._history_key(m[1], m[2]), 0))
+            moves.sort(key=order)
+        if not moves:
+            if depth <= 1:
+                return self.PASS_PENALTY
+            next_side = (side + 1) % len(hands)
+            return self.PASS_PENALTY - self._negamax(
+                board, hands, next_side, depth - 1,
+                -beta + self.PASS_PENALTY, -alpha + self.PASS_PENALTY)
+        
+        best = float("-inf")
+        best_move = None
+        for points, tile, placement in moves:
+            value = self._move_value(board, hands, side, points, tile, placement,
+                                     depth, alpha, beta)
+            if value > best:
+                best = value
+                best_move = self._move_key(tile, placement)
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                self._record_cutoff(tile, placement, depth)
+                break
+        
+        if best <= alpha_orig:
+            flag = self.UPPER
+        elif best >= beta:
+            flag = self.LOWER
+        else:
+            flag = self.EXACT
+        self._tt_store(key, (depth, best, flag, best_move))
+        return best
+    
+    @staticmethod
+    def _move_key(tile: Triomino, placement: ValidPlacement) -> tuple:
+        return (tile.canonical_id, placement.position, placement.rotation)
+    
+    @staticmethod
+    def _history_key(tile: Triomino, placement: ValidPlacement) -> tuple:
+        return (tile.canonical_id, placement.position)
+    
+    def _record_cutoff(self, tile: Triomino, placement: ValidPlacement, depth: int) -> None:
+        """Remember a move that caused a beta cutoff for ordering later."""
+        move = self._move_key(tile, placement)
+        killers = self.killers.get(depth, ())
+        if move not in killers:
+            self.killers[depth] = (move,) + killers[:1]
+        key = self._history_key(tile, placement)
+        self.history[key] = self.history.get(key, 0) + depth * depth
+    
+    def _tt_store(self, key: tuple, entry: tuple) -> None:
+        """Store an entry, evicting the oldest one once the table is full."""
+        if key not in self.tt and len(self.tt) >= self.tt_size:
+            del self.tt[next(iter(self.tt))]
+        self.tt[key] = entry
+
+
+def _fill_grid(tiles, offset_q, offset_r, grid):
+    """Write (q, r, v0, v1, v2) tile rows into the observation grid in place."""
+    size_q, size_r = grid.shape[1], grid.shape[2]
+    for i in range(tiles.shape[0]):
+        gq = tiles[i, 0] + offset_q
+        gr = tiles[i, 1] + offset_r
+        if 0 <= gq < size_q and 0 <= gr < size_r:
+            grid[0, gq, gr] = 1.0
+            grid[1, gq, gr] = tiles[i, 2] / 5.0
+            grid[2, gq, gr] = tiles[i, 3] / 5.0
+            grid[3, gq, gr] = tiles[i, 4] / 5.0
+
+
+# Numba-compiled _fill_grid; None until loaded, False when Numba is missing
+_fill_grid_jit = None
+
+
+def _load_fill_grid():
+    """Compile _fill_grid with Numba on first use (None if unavailable)."""
+    global _fill_grid_jit
+    if _fill_grid_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _fill_grid_jit = False
+        else:
+            _fill_grid_jit = njit(cache=True)(_fill_grid)
+    return _fill_grid_jit or None
+
+
+# Loaded MaskablePPO models by path, shared by every RLStrategy in the process
+_MODEL_CACHE: Dict[str, Any] = {}
+
 
 class RLStrategy(AIStrategy):
     """
@@ -171,23 +439,43 @@ class RLStrategy(AIStrategy):
 
     name = "RL"
 
+    # Divisors that normalize the observation "state" vector
+    _STATE_SCALE = (400.0, 400.0, 56.0, 20.0, 20.0, 1.0)
+
     def __init__(self, model_path: str = "models/triomino_rl/final_model.zip"):
         self.model_path = model_path
         self.model = None
         self._load_error = None
         self.game = None
+        self._player_idx: Dict[int, int] = {}
+        # Placements per hand index, filled by _build_action_mask for choose_move
+        self._last_placements: Dict[int, List[ValidPlacement]] = {}
+        # Observation arrays, allocated on first use and refilled every turn
+        self._obs = None
 
     def set_game(self, game) -> None:
         self.game = game
+        self._player_idx = {id(p): i for i, p in enumerate(game.players)}
 
     def _ensure_model(self) -> None:
         if self.model is not None or self._load_error is not None:
             return
+        self.model = _MODEL_CACHE.get(self.model_path)
+        if self.model is not None:
+            return
         try:
             from sb3_contrib import MaskablePPO
             self.model = MaskablePPO.load(self.model_path)
         except Exception as exc:
             self._load_error = exc
+            return
+        _MODEL_CACHE[self.model_path] = self.model
+        # Compile the grid kernel now so the first turn doesn't pay for it
+        fill_grid = _load_fill_grid()
+        if fill_grid is not None:
+            import numpy as np
+            fill_grid(np.zeros((1, 5), dtype=np.int64), 0, 0,
+                      np.zeros((4, 1, 1), dtype=np.float32))
 
     def _build_observation(self, player_idx: int):
         import numpy as np
@@ -195,14 +483,29 @@ class RLStrategy(AIStrategy):
         GRID_SIZE = 64
         CHANNELS = 4
 
-        grid = np.zeros((CHANNELS, GRID_SIZE, GRID_SIZE), dtype=np.float32)
+        if self._obs is None:
+            self._obs = {
+                "board": np.zeros((CHANNELS, GRID_SIZE, GRID_SIZE), dtype=np.float32),
+                "hand": np.zeros((MAX_HAND_SIZE, 3), dtype=np.float32),
+                "hand_mask": np.zeros((MAX_HAND_SIZE,), dtype=np.float32),
+                "state": np.zeros((6,), dtype=np.float32),
+            }
+        else:
+            for buf in self._obs.values():
+                buf.fill(0)
+        grid = self._obs["board"]
+        hand = self._obs["hand"]
+        hand_mask = self._obs["hand_mask"]
 
         center_q, center_r = GRID_SIZE // 2, GRID_SIZE // 2
-        if self.game.board.tiles:
-            min_q = min(t.q for t in self.game.board.tiles.values())
-            max_q = max(t.q for t in self.game.board.tiles.values())
-            min_r = min(t.r for t in self.game.board.tiles.values())
-            max_r = max(t.r for t in self.game.board.tiles.values())
+        tiles = self.game.board.tiles
+        # One row per placed tile: (q, r, v0, v1, v2)
+        arr = np.array(
+            [(q, r, *placed.values) for (q, r, _), placed in tiles.items()],
+            dtype=np.int64,
+        ).reshape(len(tiles), 5)
+        if tiles:
+            min_q, max_q, min_r, max_r = self.game.board.get_bounds()
             mid_q = (min_q + max_q) // 2
             mid_r = (min_r + max_r) // 2
         else:
@@ -211,60 +514,56 @@ class RLStrategy(AIStrategy):
         offset_q = center_q - mid_q
         offset_r = center_r - mid_r
 
-        for pos, placed in self.game.board.tiles.items():
-            q, r, _ = pos
-            gq = q + offset_q
-            gr = r + offset_r
-            if 0 <= gq < GRID_SIZE and 0 <= gr < GRID_SIZE:
-                grid[0, gq, gr] = 1.0
-                v = placed.values
-                grid[1, gq, gr] = v[0] / 5.0
-                grid[2, gq, gr] = v[1] / 5.0
-                grid[3, gq, gr] = v[2] / 5.0
-
-        hand = np.zeros((MAX_HAND_SIZE, 3), dtype=np.float32)
-        hand_mask = np.zeros((MAX_HAND_SIZE,), dtype=np.float32)
+        fill_grid = _load_fill_grid()
+        if fill_grid is not None:
+            fill_grid(arr, offset_q, offset_r, grid)
+        else:
+            gq = arr[:, 0] + offset_q
+            gr = arr[:, 1] + offset_r
+            in_grid = (gq >= 0) & (gq < GRID_SIZE) & (gr >= 0) & (gr < GRID_SIZE)
+            gq, gr = gq[in_grid], gr[in_grid]
+            grid[0, gq, gr] = 1.0
+            grid[1:, gq, gr] = (arr[in_grid, 2:] / 5.0).T
+
         player = self.game.players[player_idx]
-        for i, tile in enumerate(player.hand):
-            if i >= MAX_HAND_SIZE:
-                break
-            hand[i] = [v / 5.0 for v in tile.values]
-            hand_mask[i] = 1.0
-
-        state = np.array([
-            player.score / 400.0,
-            self.game.players[1 - player_idx].score / 400.0,
-            len(self.game.pool) / 56.0,
-            len(player.hand) / 20.0,
-            len(self.game.players[1 - player_idx].hand) / 20.0,
+        values = [tile.values for tile in player.hand[:MAX_HAND_SIZE]]
+        if values:
+            hand[:len(values)] = np.array(values, dtype=np.float64) / 5.0
+            hand_mask[:len(values)] = 1.0
+
+        opponent = self.game.players[1 - player_idx]
+        self._obs["state"][:] = np.array([
+            player.score,
+            opponent.score,
+            self.game.pool_remaining,
+            len(player.hand),
+            len(opponent.hand),
             0.0,
-        ], dtype=np.float32)
+        ], dtype=np.float64) / self._STATE_SCALE
 
-        return {
-            "board": grid,
-            "hand": hand,
-            "hand_mask": hand_mask,
-            "state": state,
-        }
+        return self._obs
 
     def _build_action_mask(self, player_idx: int):
+        import numpy as np
         MAX_HAND_SIZE = 30
-        mask = [False] * (MAX_HAND_SIZE + 2)
+        mask = np.zeros(MAX_HAND_SIZE + 2, dtype=bool)
         player = self.game.players[player_idx]
         can_play_any = False
         for i, tile in enumerate(player.hand):
             if i >= MAX_HAND_SIZE:
                 break
-            if self.game.board.find_valid_placements(tile):
+            placements = self.game.board.find_valid_placements(tile)
+            if placements:
                 mask[i] = True
                 can_play_any = True
+                self._last_placements[i] = placements
 
         # Draw only when no valid moves (rule)
-        if len(self.game.pool) > 0 and not can_play_any:
+        if self.game.pool_remaining > 0 and not can_play_any:
             mask[MAX_HAND_SIZE] = True
 
         # Pass only when no moves and cannot draw
-        if not can_play_any and len(self.game.pool) == 0:
+        if not can_play_any and self.game.pool_remaining == 0:
             mask[MAX_HAND_SIZE + 1] = True
 
         return mask
@@ -277,7 +576,8 @@ class RLStrategy(AIStrategy):
         if self.model is None:
             return GreedyStrategy().choose_move(player, board)
 
-        player_idx = self.game.players.index(player)
+        player_idx = self._player_idx[id(player)]
+        self._last_placements.clear()
         obs = self._build_observation(player_idx)
         mask = self._build_action_mask(player_idx)
 
@@ -286,6 +586,10 @@ class RLStrategy(AIStrategy):
         except Exception:
             return GreedyStrategy().choose_move(player, board)
 
+        return self._move_for_action(player, action)
+
+    def _move_for_action(self, player: Player, action) -> Optional[ScoredMove]:
+        """Turn a predicted action into a move (None for draw/pass actions)."""
         MAX_HAND_SIZE = 30
         if action >= MAX_HAND_SIZE:
             return None
@@ -294,34 +598,82 @@ class RLStrategy(AIStrategy):
             return None
 
         tile = player.hand[action]
-        placements = board.find_valid_placements(tile)
+        placements = self._last_placements.get(action)
         if not placements:
             return None
 
-        def score_placement(p):
-            t_copy = tile.copy()
-            t_copy.rotation = p.rotation
-            score = sum(t_copy.values)
-            score += p.bridge_count * 40
-            score += p.hexagon_count * 50
-            return score
+        # Rotation doesn't change the tile sum, so only the bonus ranks placements
+        best = max(placements, key=lambda p: p.bonus_points)
+        return ScoredMove(tile=tile, placement=best, base_score=tile.sum_value,
+                          bonus_score=best.bonus_points)
+
+    @classmethod
+    def choose_moves_batch(cls, strategies: List[RLStrategy],
+                           players: List[Player]) -> List[Optional[ScoredMove]]:
+        """
+        Choose moves for several RL players with one batched predict call.
+
+        Each strategy must be bound to its own game (see set_game), appear
+        only once, and all of them must share a model path. Falls back to
+        per-player choose_move otherwise, or if the batched call fails.
+        """
+        def one_by_one():
+            return [s.choose_move(p, s.game.board if s.game else None)
+                    for s, p in zip(strategies, players)]
+
+        if not strategies:
+            return []
+        # A repeated instance would refill its observation buffers and
+        # placement map for the second player before the first one is used
+        if len({id(s) for s in strategies}) != len(strategies):
+            return one_by_one()
+        for strat in strategies:
+            if strat.game:
+                strat._ensure_model()
+        model = strategies[0].model
+        if model is None or any(s.game is None or s.model is not model for s in strategies):
+            return one_by_one()
+
+        import numpy as np
+        observations, masks = [], []
+        for strat, player in zip(strategies, players):
+            player_idx = strat._player_idx[id(player)]
+            strat._last_placements.clear()
+            observations.append(strat._build_observation(player_idx))
+            masks.append(strat._build_action_mask(player_idx))
+        batch = {key: np.stack([obs[key] for obs in observations])
+                 for key in observations[0]}
+
+        try:
+            actions, _ = model.predict(batch, deterministic=True,
+                                       action_masks=np.stack(masks))
+        except Exception:
+            return one_by_one()
 
-        best = max(placements, key=score_placement)
-        bonus = (best.hexagon_count * 50) + (best.bridge_count * 40)
-        return ScoredMove(tile=tile, placement=best, base_score=tile.sum_value, bonus_score=bonus)
+        return [strat._move_for_action(player, int(action))
+                for strat, player, action in zip(strategies, players, actions)]
 
 
 # Default strategy
 DEFAULT_STRATEGY = GreedyStrategy()
 
 
+# Strategies without per-game state are shared; RL, minimax and random bind to
+# a game through set_game, so each call gets its own instance.
+_SHARED_STRATEGIES = {
+    'greedy': GreedyStrategy(),
+    'balanced': BalancedStrategy(),
+    'defensive': DefensiveStrategy(),
+}
+
+
 def get_strategy(name: str) -> AIStrategy:
     """Get a strategy by name."""
-    strategies = {
-        'greedy': GreedyStrategy(),
-        'balanced': BalancedStrategy(),
-        'defensive': DefensiveStrategy(),
-        'random': RandomStrategy(),
-        'rl': RLStrategy(),
-    }
-    return strategies.get(name.lower(), DEFAULT_STRATEGY)
+    key = name.lower()
+    if key == 'rl':
+        return RLStrategy()
+    if key in ('minimax', 'alphabeta'):
+        return MinimaxStrategy()
+    if key == 'random':
+        return RandomStrategy()
+    return _SHARED_STRATEGIES.get(key, DEFAULT_STRATEGY)
@@ -2,23 +2,29 @@
 """
 Triominó - Human vs AI Interactive Game (CLI)
 """
+from __future__ import annotations
 import sys
 import os
 import argparse
 import random
 import logging
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.engine.game import TriominoGame, TurnAction, TurnResult
 from src.engine.rules import calculate_pass_penalty, calculate_draw_failure_penalty
 from src.ai.strategies import AIStrategy, get_strategy, ScoredMove
 from src.models import Triomino, ValidPlacement, Player, GameBoard, create_shuffled_deck
-from src.visualization.renderer import GameRenderer
-import matplotlib.pyplot as plt
+
+# matplotlib is slow to import, so it's only loaded when the window is used
+if TYPE_CHECKING:
+    from src.visualization.renderer import GameRenderer
 
 LOGGER = None
 
+_SEP = "=" * 60
+_HAND_FOOTER = "  [D] Draw Tile\n  [P] Pass Turn\n"
+
 
 def setup_logger():
     os.makedirs("logs/cli", exist_ok=True)
@@ -33,6 +39,35 @@ def setup_logger():
     logger.propagate = False
     return logger
 
+def _poll_input(prompt: str, renderer: Optional[GameRenderer], timeout: float = 0.05) -> str:
+    """
+    input() that keeps the matplotlib window responsive while waiting.
+
+    Polls stdin with a short timeout and runs the GUI event loop between
+    polls; without a renderer this is a plain input().
+    """
+    if renderer is None:
+        return input(prompt)
+
+    import matplotlib.pyplot as plt
+    print(prompt, end="", flush=True)
+    if os.name == "nt":
+        import msvcrt
+        # select() only handles sockets on Windows; wait for a keypress instead
+        while not msvcrt.kbhit():
+            plt.pause(timeout)
+        return input()
+
+    import select
+    while True:
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if ready:
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            return line.rstrip("\n")
+        plt.pause(timeout)
+
 class HumanStrategy(AIStrategy):
     """
     Interactive strategy that asks the user for input via CLI.
@@ -44,28 +79,30 @@ class HumanStrategy(AIStrategy):
         # Returning None signals "no move decided automatically".
         return None
 
-def print_board(game: TriominoGame, renderer: GameRenderer):
-    """Render the board graphically and simple stats in CLI."""
+def print_board(game: TriominoGame, renderer: Optional[GameRenderer]):
+    """Render the board graphically (unless --no-gui) and simple stats in CLI."""
     # Update Graphic GUI
-    renderer.draw_board(game.board, animate=True)
-    renderer.update_info_panel(game)
+    if renderer is not None:
+        renderer.draw_board(game.board, animate=True)
+        renderer.update_info_panel(game)
     
-    # CLI Stats
-    print("\n" + "="*60)
-    print(f" Round: {game.round_number} | Pool: {len(game.pool)} tiles")
-    print(f" Scores: {game.players[0].name}: {game.players[0].score} | {game.players[1].name}: {game.players[1].score}")
-    print("="*60 + "\n")
+    # CLI Stats, written in one go
+    p1, p2 = game.players[0], game.players[1]
+    sys.stdout.write(
+        f"\n{_SEP}\n"
+        f" Round: {game.round_number} | Pool: {game.pool_remaining} tiles\n"
+        f" Scores: {p1.name}: {p1.score} | {p2.name}: {p2.score}\n"
+        f"{_SEP}\n\n"
+    )
 
 
 def print_hand(player: Player):
     """Show the player's hand with indices."""
-    print(f"\nYour Hand ({len(player.hand)}):")
-    for i, tile in enumerate(player.hand):
-        print(f"  [{i}] {tile}")
-    print("  [D] Draw Tile")
-    print("  [P] Pass Turn")
+    tiles = "".join(f"  [{i}] {tile}\n" for i, tile in enumerate(player.hand))
+    sys.stdout.write(f"\nYour Hand ({len(player.hand)}):\n{tiles}{_HAND_FOOTER}")
 
-def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer) -> TurnResult:
+def get_human_input(game: TriominoGame, player: Player,
+                    renderer: Optional[GameRenderer]) -> TurnResult:
     """Handle the interactive turn loop for the human."""
     draws_made = 0
     
@@ -75,10 +112,10 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
         
         # Check if we can play anything
         can_play = game.can_player_move(player)
-        if not can_play and len(game.pool) == 0 and draws_made >= 3:
+        if not can_play and game.pool_remaining == 0 and draws_made >= 3:
              print("\n⚠️ No moves possible and cannot draw more. You must PASS.")
         
-        choice = input(f"\nTarget> ").strip().lower()
+        choice = _poll_input(f"\nTarget> ", renderer).strip().lower()
         
         if choice in ['q', 'quit', 'exit']:
             print("Thanks for playing!")
@@ -88,15 +125,15 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
             # Draw
             if can_play:
                 print("❌ You must play a tile if possible.")
-                input("Press Enter...")
+                _poll_input("Press Enter...", renderer)
                 continue
-            if len(game.pool) == 0:
+            if game.pool_remaining == 0:
                 print("❌ Pool is empty!")
-                input("Press Enter...")
+                _poll_input("Press Enter...", renderer)
                 continue
             if draws_made >= 3:
                 print("❌ Max draws (3) reached!")
-                input("Press Enter...")
+                _poll_input("Press Enter...", renderer)
                 continue
                 
             count = game.execute_draw(player)
@@ -106,7 +143,7 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
                 print(f"🀄 You drew: {drawn_tile}")
                 if LOGGER:
                     LOGGER.info("Draw tile: player=%s draws_made=%s pool=%s",
-                                player.name, draws_made, len(game.pool))
+                                player.name, draws_made, game.pool_remaining)
                 # Check if playable?
             continue
             
@@ -114,11 +151,11 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
             # Pass
             if can_play:
                 print("❌ You must play a tile if possible.")
-                input("Press Enter...")
+                _poll_input("Press Enter...", renderer)
                 continue
-            if len(game.pool) > 0 and draws_made < 3:
+            if game.pool_remaining > 0 and draws_made < 3:
                  print("❌ You cannot pass yet! You must draw if you can't play.")
-                 input("Press Enter...")
+                 _poll_input("Press Enter...", renderer)
                  continue
 
             if draws_made > 0:
@@ -131,7 +168,7 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
                 LOGGER.info("Pass: player=%s points=%s draws_made=%s",
                             player.name, points, draws_made)
             game.next_player()
-            return TurnResult(player, TurnAction.PASS, None, draws_made, points, [event], "Passed")
+            return TurnResult(player, TurnAction.PASS, None, draws_made, points, (event,), message="Passed")
 
         # Try tile index
         try:
@@ -146,48 +183,54 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
             placements = game.board.find_valid_placements(tile)
             if not placements:
                 print(f"❌ Tile {tile} cannot be placed anywhere.")
-                input("Press Enter...")
+                _poll_input("Press Enter...", renderer)
                 continue
             
             # Create list of ghost tiles for visualization
             options = []
             for i, p in enumerate(placements):
-                # Calculate score for display (optional)
-                t_copy = tile.copy()
-                t_copy.rotation = p.rotation
                 # Ghost tile to draw
                 from src.models import PlacedTile
                 ghost = PlacedTile(
-                    tile=t_copy,
+                    tile=tile,
                     q=p.row,
                     r=p.col,
-                    player_id=game.players.index(player),
-                    orientation=p.orientation
+                    player_id=game.player_index(player),
+                    orientation=p.orientation,
+                    rotation=p.rotation
                 )
                 options.append((ghost, i + 1)) # 1-based index
             
-            # Show ghosts on GUI
-            renderer.draw_board(game.board, animate=False) # Clear previous ghosts
-            renderer.draw_ghost_placements(options)
+            # Show ghosts on GUI, or list them in text mode
+            if renderer is not None:
+                renderer.draw_board(game.board, animate=False) # Clear previous ghosts
+                renderer.draw_ghost_placements(options)
+                print(f"\n🎯 Found {len(placements)} valid options. Look at the window!")
+            else:
+                print(f"\n🎯 Found {len(placements)} valid options:")
+                for ghost, n in options:
+                    print(f"  [{n}] ({ghost.q}, {ghost.r}, {ghost.orientation}) as {ghost.tile}")
             
             # Ask user to choose
-            print(f"\n🎯 Found {len(placements)} valid options. Look at the window!")
             print(f"   Enter number [1-{len(placements)}] to confirm, or 0 to cancel:")
             
             try:
-                sel = int(input("Option> ").strip())
+                sel = int(_poll_input("Option> ", renderer).strip())
                 if sel == 0:
-                    renderer.draw_board(game.board) # Clear ghosts
+                    if renderer is not None:
+                        renderer.draw_board(game.board) # Clear ghosts
                     continue
                 if sel < 1 or sel > len(placements):
                     print("❌ Invalid option.")
-                    renderer.draw_board(game.board)
+                    if renderer is not None:
+                        renderer.draw_board(game.board)
                     continue
                 
                 selected_placement = placements[sel-1]
                 
                 print(f"✅ Placing {tile} at option {sel}...")
-                renderer.draw_board(game.board) # Clear ghosts before animating? 
+                if renderer is not None:
+                    renderer.draw_board(game.board) # Clear ghosts before animating? 
                 # Actually execute_place will trigger next turn loop which calls print_board, 
                 # so it will clean up naturally.
                 
@@ -200,7 +243,8 @@ def get_human_input(game: TriominoGame, player: Player, renderer: GameRenderer)
                 
             except ValueError:
                 print("❌ Invalid input.")
-                renderer.draw_board(game.board)
+                if renderer is not None:
+                    renderer.draw_board(game.board)
                 continue
             
         except ValueError:
@@ -211,10 +255,12 @@ def main():
     LOGGER = setup_logger()
 
     parser = argparse.ArgumentParser(description="Triominó - Human vs AI")
-    parser.add_argument("--difficulty", type=str, default="greedy", choices=["random", "greedy", "human"],
-                      help="Opponent type: 'human', 'greedy', or 'random'")
+    parser.add_argument("--difficulty", type=str, default="greedy", choices=["random", "greedy", "minimax", "human"],
+                      help="Opponent type: 'human', 'greedy', 'minimax', or 'random'")
     parser.add_argument("--name", type=str, default="Player 1", help="Your player name")
     parser.add_argument("--name2", type=str, default="Player 2", help="Second player name (for human vs human)")
+    parser.add_argument("--no-gui", "--headless", dest="no_gui", action="store_true",
+                      help="Text-only play, without the matplotlib board window")
     args = parser.parse_args()
 
     # Setup
@@ -246,9 +292,13 @@ def main():
     )
     
     # Init Renderer
-    renderer = GameRenderer()
-    renderer.setup_figure()
-    plt.show(block=False)  # Show non-blocking
+    renderer = None
+    if not args.no_gui:
+        import matplotlib.pyplot as plt
+        from src.visualization.renderer import GameRenderer
+        renderer = GameRenderer()
+        renderer.setup_figure()
+        plt.show(block=False)  # Show non-blocking
     
     game.setup_round()
     
@@ -258,16 +308,19 @@ def main():
     print(f"   Points: {opening_res.points_earned}")
     
     # Update view after opening
-    renderer.draw_board(game.board)
-    renderer.update_info_panel(game)
+    if renderer is not None:
+        renderer.draw_board(game.board)
+        renderer.update_info_panel(game)
     
     game.next_player()
     
+    # Seats are fixed for the whole game, so check for humans once
+    human_seats = [isinstance(s, HumanStrategy) for s in game.strategies]
+    
     # Game Loop
     while not game.game_over:
         current = game.current_player
-        current_strategy = game.strategies[game.current_player_idx]
-        is_human = isinstance(current_strategy, HumanStrategy)
+        is_human = human_seats[game.current_player_idx]
         
         print(f"\n>>> Turn: {current.name}")
         
@@ -277,12 +330,14 @@ def main():
         else:
             # AI Turn
             print("🤖 AI is thinking...")
-            plt.pause(0.5) # Thinking time
+            if renderer is not None:
+                plt.pause(0.5) # Thinking time
             turn_res = game.play_turn()
             
             # Update Render
-            renderer.draw_board(game.board)
-            renderer.update_info_panel(game, turn_res)
+            if renderer is not None:
+                renderer.draw_board(game.board)
+                renderer.update_info_panel(game, turn_res)
             
             print(f"   {turn_res.message}")
             if turn_res.points_earned > 0:
@@ -306,9 +361,10 @@ def main():
             game.game_over = True 
             
             # Keep window open
-            renderer.show_match_result(round_res.winner.name, {})
-            print("Close graphics window to finish.")
-            plt.show(block=True)
+            if renderer is not None:
+                renderer.show_match_result(round_res.winner.name, {})
+                print("Close graphics window to finish.")
+                plt.show(block=True)
 
 
 if __name__ == "__main__":
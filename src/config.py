@@ -4,22 +4,113 @@ Configuration loader for Triomino project.
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+# Prefer a C JSON parser when one is installed; all of them accept bytes.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "default.json"
 
 
-def load_config(path: Optional[str] = None) -> Dict[str, Any]:
+@dataclass(frozen=True, slots=True)
+class PlayerConfig:
+    """A configured player: display name and strategy key."""
+    name: str
+    strategy: str = "greedy"
+
+
+DEFAULT_PLAYERS = (
+    PlayerConfig("CPU-Alpha"),
+    PlayerConfig("CPU-Beta"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SimConfig:
+    """Parsed simulation settings, built once from the JSON config."""
+    matches: int = 5
+    seed: Optional[int] = None
+    delay: float = 0.3
+    fast: bool = False
+    target_score: int = 400
+    log_enabled: bool = False
+    log_dir: str = "runs"
+    players: Tuple[PlayerConfig, ...] = DEFAULT_PLAYERS
+
+    @property
+    def player_names(self) -> list[str]:
+        return [p.name for p in self.players]
+
+    @property
+    def strategy_names(self) -> list[str]:
+        return [p.strategy for p in self.players]
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> "SimConfig":
+        """Build a SimConfig from a raw config dict, filling in defaults."""
+        simulation = config.get("simulation", {})
+        logging_cfg = config.get("logging", {})
+        players = tuple(
+            PlayerConfig(
+                name=p.get("name", f"Player {i+1}"),
+                strategy=p.get("strategy", "greedy"),
+            )
+            for i, p in enumerate(config.get("players", []))
+        )
+        seed = simulation.get("seed")
+        return cls(
+            matches=int(simulation.get("matches", 5)),
+            seed=int(seed) if seed is not None else None,
+            delay=float(simulation.get("delay", 0.3)),
+            fast=bool(simulation.get("fast", False)),
+            target_score=int(config.get("game", {}).get("target_score", 400)),
+            log_enabled=bool(logging_cfg.get("enabled", False)),
+            log_dir=str(logging_cfg.get("run_dir", "runs")),
+            players=players or DEFAULT_PLAYERS,
+        )
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: objects become mapping proxies, arrays tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=8)
+def _parse_config(cfg_path: Path, mtime_ns: int) -> Mapping[str, Any]:
+    # mtime_ns is only part of the cache key, so edited files are re-read.
+    # Frozen all the way down: the cached result is shared by every caller.
+    return _freeze(json_loads(cfg_path.read_bytes()))
+
+
+def load_config(path: Optional[str] = None) -> Mapping[str, Any]:
     """
     Load JSON configuration.
 
+    Parsed files are cached per resolved path and modification time, so
+    the result is shared between callers and read-only at every level
+    (nested objects are mappings, arrays are tuples).
+
     Args:
         path: Optional custom config path.
     """
-    cfg_path = Path(path) if path else DEFAULT_CONFIG_PATH
+    cfg_path = (Path(path) if path else DEFAULT_CONFIG_PATH).resolve()
     if not cfg_path.exists():
         raise FileNotFoundError(f"Config not found: {cfg_path}")
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _parse_config(cfg_path, cfg_path.stat().st_mtime_ns)
+
+
+def load_sim_config(path: Optional[str] = None) -> SimConfig:
+    """Load the JSON configuration and parse it into a SimConfig."""
+    return SimConfig.from_dict(load_config(path))
@@ -6,7 +6,8 @@ Main game loop managing rounds, turns, and game state.
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Callable
+import random
+from typing import Dict, List, Optional, Callable, Sequence, Tuple
 
 from src.models import (
     Triomino, Player, GameBoard, PlacementResult, 
@@ -21,6 +22,19 @@ from src.engine.rules import (
 )
 from src.ai.strategies import AIStrategy, get_strategy
 
+# Opening, draw-failure and pass scores depend on a handful of small inputs, so
+# they are computed once; ScoreEvent is frozen, so the events are shared
+_OPENING_SCORES: Dict[Tuple[int, bool, bool], Tuple[int, ScoreEvent]] = {
+    (total, triple, zero): calculate_opening_score(total, triple, zero)
+    for total in range(16) for triple in (False, True) for zero in (False, True)
+}
+_DRAW_FAILURE_PENALTIES: List[Tuple[int, ScoreEvent]] = [
+    calculate_draw_failure_penalty(draws) for draws in range(MAX_DRAWS_PER_TURN + 1)
+]
+_PASS_PENALTY: Tuple[int, ScoreEvent] = calculate_pass_penalty()
+# Placement scores by (base points, hexagons, bridges, draws), filled on first use
+_PLACEMENT_SCORES: Dict[Tuple[int, int, int, int], Tuple[int, Tuple[ScoreEvent, ...]]] = {}
+
 
 class TurnAction(Enum):
     PLACE_TILE = "place"
@@ -33,19 +47,19 @@ class RoundEndReason(Enum):
     GAME_BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class TurnResult:
     player: Player
     action: TurnAction
     tile_placed: Optional[PlacedTile] = None
     tiles_drawn: int = 0
     points_earned: int = 0
-    events: List[ScoreEvent] = field(default_factory=list)
+    events: Sequence[ScoreEvent] = ()
     success: bool = True
     message: str = ""
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class RoundResult:
     winner: Player
     reason: RoundEndReason
@@ -53,7 +67,7 @@ class RoundResult:
     final_scores: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class GameResult:
     winner: Player
     rounds_played: int
@@ -71,24 +85,40 @@ class TriominoGame:
             player_names = ["Computer 1", "Computer 2"]
         
         self.players = [Player(name=name, is_computer=True) for name in player_names]
+        # Seat of each player by identity (players.index compares by value)
+        self._player_idx = {id(p): i for i, p in enumerate(self.players)}
+        # With 2 or 4 players the seat wraps with a mask instead of a modulo
+        n = len(self.players)
+        self._seat_mask: Optional[int] = n - 1 if n & (n - 1) == 0 else None
         if strategies is None:
             strategies = [get_strategy("greedy") for _ in self.players]
         if len(strategies) != len(self.players):
             raise ValueError("Number of strategies must match number of players")
         self.strategies = strategies
+        self.seed = seed
+        # Per-game randomness (unseeded decks, random strategies); never the global module
+        self.rng = random.Random(seed)
         for strat in self.strategies:
             if hasattr(strat, "set_game"):
                 strat.set_game(self)
         self.target_score = target_score
-        self.seed = seed
         
         self.board = GameBoard()
-        self.pool: List[Triomino] = []
+        # Shuffled deck in draw order; tiles before pool_cursor are dealt
+        self._pool_tiles: Tuple[Triomino, ...] = ()
+        self.pool_cursor = 0
         self.current_player_idx = 0
         self.round_number = 0
         self.is_final_round = False
         self.final_round_triggered = False
         self.game_over = False
+        # Openings and turns played so far, so callers need no callback to count
+        self.turns_played = 0
+        
+        # Per seat: (board, board.version, hand_version, can_move) of the last check
+        self._can_move_cache: Dict[int, Tuple[GameBoard, int, int, bool]] = {}
+        # (board, board.version) at which someone was last seen able to move
+        self._movable_at: Optional[Tuple[GameBoard, int]] = None
         
         self._on_tile_placed: Optional[Callable] = None
         self._on_turn_complete: Optional[Callable] = None
@@ -101,14 +131,31 @@ class TriominoGame:
     @property
     def num_players(self) -> int:
         return len(self.players)
+
+    def player_index(self, player: Player) -> int:
+        """Seat index of a player in this game."""
+        return self._player_idx[id(player)]
+
+    @property
+    def pool_remaining(self) -> int:
+        """Number of tiles left to draw."""
+        return len(self._pool_tiles) - self.pool_cursor
+
+    @property
+    def pool(self) -> List[Triomino]:
+        """Copy of the undrawn tiles, next draw last (draw via execute_draw)."""
+        return list(reversed(self._pool_tiles[self.pool_cursor:]))
     
     def setup_round(self) -> None:
         self.round_number += 1
         
         if self.seed is not None:
-            self.pool = create_shuffled_deck(seed=self.seed + self.round_number)
+            deck = create_shuffled_deck(seed=self.seed + self.round_number)
         else:
-            self.pool = create_shuffled_deck()
+            deck = create_shuffled_deck(rng=self.rng)
+        # Tiles are drawn from the end of the shuffled deck
+        self._pool_tiles = tuple(reversed(deck))
+        self.pool_cursor = 0
         
         self.board = GameBoard()
         
@@ -117,14 +164,17 @@ class TriominoGame:
         
         tiles_per_player = get_initial_tile_count(self.num_players)
         for player in self.players:
-            player.draw_tiles(self.pool, tiles_per_player)
+            end = self.pool_cursor + tiles_per_player
+            player.add_tiles(self._pool_tiles[self.pool_cursor:end])
+            self.pool_cursor = end
     
     def determine_starting_player(self) -> tuple[Player, Triomino, bool]:
         return get_starting_player(self.players)
     
     def play_opening(self) -> TurnResult:
+        self.turns_played += 1
         starter, tile, has_triple = self.determine_starting_player()
-        self.current_player_idx = self.players.index(starter)
+        self.current_player_idx = self.player_index(starter)
         
         starter.play_tile(tile)
         result = self.board.place_first_tile(
@@ -133,11 +183,9 @@ class TriominoGame:
             is_triple=has_triple
         )
         
-        points, event = calculate_opening_score(
-            tile.sum_value,
-            tile.is_triple(),
-            tile.is_triple_zero()
-        )
+        points, event = _OPENING_SCORES[
+            (tile.sum_value, tile.is_triple(), tile.is_triple_zero())
+        ]
         
         starter.add_score(points)
         
@@ -146,38 +194,46 @@ class TriominoGame:
             action=TurnAction.PLACE_TILE,
             tile_placed=result.tile,
             points_earned=points,
-            events=[event],
+            events=(event,),
             message=f"{starter.name} opens with {tile}"
         )
     
     def find_best_move(self, player: Player) -> Optional[tuple[Triomino, ValidPlacement]]:
         """Find best valid move using the player's configured strategy."""
-        idx = self.players.index(player)
-        strategy = self.strategies[idx]
+        strategy = self.strategies[self.player_index(player)]
         move = strategy.choose_move(player, self.board)
         if not move:
             return None
         return (move.tile, move.placement)
     
     def can_player_move(self, player: Player) -> bool:
+        board = self.board
+        seat = self.player_index(player)
+        cached = self._can_move_cache.get(seat)
+        if (cached is not None and cached[0] is board
+                and cached[1] == board.version and cached[2] == player.hand_version):
+            return cached[3]
+        
+        can_move = False
+        edges = board.edge_bitboard
         for tile in player.hand:
-            if self.board.find_valid_placements(tile):
-                return True
-        return False
+            # Bitboard test first; only candidates get the full placement search
+            if tile.edge_mask & edges and board.find_valid_placements(tile):
+                can_move = True
+                break
+        self._can_move_cache[seat] = (board, board.version, player.hand_version, can_move)
+        return can_move
     
     
     def execute_place(self, player: Player, tile: Triomino, placement: ValidPlacement, draws_made: int = 0) -> TurnResult:
         """Execute a placement action atomatically."""
-        # Ensure rotation is set correctly on the tile copy
-        tile.rotation = placement.rotation
-        
         result = self.board.place_tile(
             tile=tile,
             row=placement.row,
             col=placement.col,
             orientation=placement.orientation,
             rotation=placement.rotation,
-            player_id=self.players.index(player)
+            player_id=self.player_index(player)
         )
 
         if not result.success:
@@ -187,14 +243,18 @@ class TriominoGame:
                 tile_placed=None,
                 tiles_drawn=draws_made,
                 points_earned=0,
-                events=[],
                 success=False,
                 message=result.message
             )
 
         player.play_tile(tile)
         
-        points, events = calculate_placement_score(result, draws_made)
+        key = (result.base_points, result.hexagon_count, result.bridge_count, draws_made)
+        scored = _PLACEMENT_SCORES.get(key)
+        if scored is None:
+            points, events = calculate_placement_score(result, draws_made)
+            scored = _PLACEMENT_SCORES[key] = (points, tuple(events))
+        points, events = scored
         player.add_score(points)
         
         if self._on_tile_placed:
@@ -207,17 +267,19 @@ class TriominoGame:
             tiles_drawn=draws_made,
             points_earned=points,
             events=events,
-            message=f"{player.name} places {tile}"
+            message=f"{player.name} places {result.tile.tile}"
         )
         
     def execute_draw(self, player: Player) -> int:
         """Draw a tile from pool. Returns count drawn (0 or 1)."""
-        if self.pool:
-            player.draw_tiles(self.pool, 1)
+        if self.pool_cursor < len(self._pool_tiles):
+            player.add_tiles((self._pool_tiles[self.pool_cursor],))
+            self.pool_cursor += 1
             return 1
         return 0
 
     def play_turn(self) -> TurnResult:
+        self.turns_played += 1
         player = self.current_player
         draws_made = 0
         
@@ -229,7 +291,7 @@ class TriominoGame:
                 return self.execute_place(player, tile, placement, draws_made)
 
             
-            if self.pool and draws_made < MAX_DRAWS_PER_TURN:
+            if self.pool_remaining and draws_made < MAX_DRAWS_PER_TURN:
                 count = self.execute_draw(player)
                 draws_made += count
 
@@ -238,7 +300,7 @@ class TriominoGame:
             break
         
         if draws_made > 0:
-            points, event = calculate_draw_failure_penalty(draws_made)
+            points, event = _DRAW_FAILURE_PENALTIES[draws_made]
             player.add_score(points)
             
             return TurnResult(
@@ -246,29 +308,34 @@ class TriominoGame:
                 action=TurnAction.DRAW_TILE,
                 tiles_drawn=draws_made,
                 points_earned=points,
-                events=[event],
+                events=(event,),
                 success=False,
                 message=f"{player.name} drew {draws_made} but can't play"
             )
         else:
-            points, event = calculate_pass_penalty()
+            points, event = _PASS_PENALTY
             player.add_score(points)
             
             return TurnResult(
                 player=player,
                 action=TurnAction.PASS,
                 points_earned=points,
-                events=[event],
+                events=(event,),
                 message=f"{player.name} passes"
             )
     
     def next_player(self) -> None:
-        self.current_player_idx = (self.current_player_idx + 1) % self.num_players
+        if self._seat_mask is not None:
+            self.current_player_idx = (self.current_player_idx + 1) & self._seat_mask
+        else:
+            self.current_player_idx = (self.current_player_idx + 1) % self.num_players
     
     def check_round_end(self) -> Optional[RoundResult]:
         if self.current_player.has_empty_hand:
-            winner = self.current_player
-            opponent_values = [p.hand_value for p in self.players if p != winner]
+            winner_idx = self.current_player_idx
+            winner = self.players[winner_idx]
+            opponent_values = [p.hand_value for i, p in enumerate(self.players)
+                               if i != winner_idx]
             bonus, events = calculate_round_win_bonus(opponent_values)
             winner.add_score(bonus)
             
@@ -279,22 +346,36 @@ class TriominoGame:
                 final_scores={p.name: p.score for p in self.players}
             )
         
-        if not self.pool:
+        if not self.pool_remaining:
+            # With the pool empty, hands only change by placing, which bumps the
+            # board version; until then whoever could move still can
+            board = self.board
+            movable_at = self._movable_at
+            if movable_at is not None and movable_at[0] is board and movable_at[1] == board.version:
+                return None
             can_anyone_move = any(self.can_player_move(p) for p in self.players)
             if not can_anyone_move:
-                winner = min(self.players, key=lambda p: p.hand_value)
-                opponent_values = [p.hand_value for p in self.players if p != winner]
-                bonus, event = calculate_blocked_win_bonus(winner.hand_value, opponent_values)
-                winner.add_score(bonus)
-                
-                return RoundResult(
-                    winner=winner,
-                    reason=RoundEndReason.GAME_BLOCKED,
-                    winner_bonus=bonus,
-                    final_scores={p.name: p.score for p in self.players}
-                )
+                return self._blocked_round_result()
+            self._movable_at = (board, board.version)
         
         return None
+
+    def _blocked_round_result(self) -> RoundResult:
+        """Score a blocked round: the lowest hand wins the differences."""
+        hand_values = [p.hand_value for p in self.players]
+        # First lowest hand wins, as min() would pick
+        winner_idx = hand_values.index(min(hand_values))
+        winner = self.players[winner_idx]
+        opponent_values = hand_values[:winner_idx] + hand_values[winner_idx + 1:]
+        bonus, _ = calculate_blocked_win_bonus(hand_values[winner_idx], opponent_values)
+        winner.add_score(bonus)
+        
+        return RoundResult(
+            winner=winner,
+            reason=RoundEndReason.GAME_BLOCKED,
+            winner_bonus=bonus,
+            final_scores={p.name: p.score for p in self.players}
+        )
     
     def check_game_end(self) -> bool:
         return any(p.score >= self.target_score for p in self.players)
@@ -321,12 +402,10 @@ class TriominoGame:
             if self._on_turn_complete:
                 self._on_turn_complete(turn)
             
-            if turn.action == TurnAction.PASS:
-                consecutive_passes += 1
-                if consecutive_passes >= max_passes:
-                    break
-            else:
-                consecutive_passes = 0
+            # Enum members are singletons: identity is enough; any other action resets
+            consecutive_passes = (consecutive_passes + 1) * (turn.action is TurnAction.PASS)
+            if consecutive_passes >= max_passes:
+                break
             
             round_result = self.check_round_end()
             if round_result:
@@ -336,17 +415,7 @@ class TriominoGame:
             
             self.next_player()
         
-        winner = min(self.players, key=lambda p: p.hand_value)
-        opponent_values = [p.hand_value for p in self.players if p != winner]
-        bonus, _ = calculate_blocked_win_bonus(winner.hand_value, opponent_values)
-        winner.add_score(bonus)
-        
-        return RoundResult(
-            winner=winner,
-            reason=RoundEndReason.GAME_BLOCKED,
-            winner_bonus=bonus,
-            final_scores={p.name: p.score for p in self.players}
-        )
+        return self._blocked_round_result()
     
     def play_game(self) -> GameResult:
         while not self.game_over:
@@ -371,13 +440,58 @@ class TriominoGame:
             rounds_played=self.round_number,
             final_scores={p.name: p.score for p in self.players}
         )
+
+    def play_game_fast(self) -> GameResult:
+        """
+        Play a whole game with no callbacks, for headless AI evaluation.
+
+        Same rules and results as play_game, with play_round inlined and the
+        callback checks dropped; only the final GameResult is produced.
+        """
+        players = self.players
+        play_turn = self.play_turn
+        check_round_end = self.check_round_end
+        next_player = self.next_player
+        max_passes = self.num_players * 2
+        
+        while not self.game_over:
+            if self.final_round_triggered:
+                self.is_final_round = True
+            
+            self.setup_round()
+            self.play_opening()
+            if check_round_end() is None:
+                next_player()
+                consecutive_passes = 0
+                while True:
+                    turn = play_turn()
+                    consecutive_passes = (consecutive_passes + 1) * (turn.action is TurnAction.PASS)
+                    if consecutive_passes >= max_passes:
+                        self._blocked_round_result()
+                        break
+                    if check_round_end() is not None:
+                        break
+                    next_player()
+            
+            if self.is_final_round:
+                self.game_over = True
+                break
+            if self.check_game_end():
+                self.final_round_triggered = True
+        
+        winner = max(players, key=lambda p: p.score)
+        return GameResult(
+            winner=winner,
+            rounds_played=self.round_number,
+            final_scores={p.name: p.score for p in players}
+        )
     
     def get_game_state(self) -> dict:
         return {
             'round': self.round_number,
             'current_player': self.current_player.name,
             'board_tiles': self.board.tile_count,
-            'pool_remaining': len(self.pool),
+            'pool_remaining': self.pool_remaining,
             'is_final_round': self.is_final_round,
             'scores': {p.name: p.score for p in self.players},
             'hands': {p.name: p.hand_size for p in self.players}
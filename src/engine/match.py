@@ -4,18 +4,28 @@ Match Simulator
 Runs multiple games between computer players and collects statistics.
 """
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable
-from datetime import datetime
+from typing import List, Optional, Callable, Tuple
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 import json
+import os
 import time
 
-from src.engine.game import TriominoGame, GameResult, RoundResult, TurnResult
+from src.engine.game import TriominoGame, GameResult, RoundResult
 from src.ai.strategies import get_strategy, AIStrategy
 
+# Prefer a C JSON encoder when one is installed; it writes compact UTF-8 bytes.
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-@dataclass
+
+@dataclass(eq=False, slots=True)
 class MatchStats:
     """Statistics for a series of matches."""
     total_matches: int = 0
@@ -34,10 +44,11 @@ class MatchStats:
         winner_name = result.winner.name
         self.wins_per_player[winner_name] = self.wins_per_player.get(winner_name, 0) + 1
         
-        for player_name, score in result.final_scores.items():
-            if score > self.highest_score:
-                self.highest_score = score
-                self.highest_scorer = player_name
+        # max keeps the first of tied players, as the old per-player scan did
+        top_name, top_score = max(result.final_scores.items(), key=itemgetter(1))
+        if top_score > self.highest_score:
+            self.highest_score = top_score
+            self.highest_scorer = top_name
         
         self.avg_rounds_per_match = self.total_rounds / self.total_matches
     
@@ -57,13 +68,17 @@ class MatchStats:
         print("=" * 50)
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class MatchResult:
     """Result of a simulated match."""
     game_result: GameResult
-    duration_seconds: float
+    duration_ns: int  # Monotonic wall time from perf_counter_ns
     turns_played: int
     
+    @property
+    def duration_seconds(self) -> float:
+        return self.duration_ns / 1e9
+    
     def __repr__(self) -> str:
         winner = self.game_result.winner.name
         rounds = self.game_result.rounds_played
@@ -82,7 +97,8 @@ class MatchSimulator:
                  target_score: int = 400,
                  strategy_names: Optional[List[str]] = None,
                  log_enabled: bool = False,
-                 log_dir: str = "runs"):
+                 log_dir: str = "runs",
+                 workers: Optional[int] = None):
         """
         Initialize the match simulator.
         
@@ -90,6 +106,7 @@ class MatchSimulator:
             num_matches: Number of complete games to simulate
             player_names: Names for the players
             target_score: Points needed to win
+            workers: Processes for running matches (None = one per CPU, 1 = serial)
         """
         if player_names is None:
             player_names = ["🔴 CPU-Alpha", "🔵 CPU-Beta"]
@@ -102,8 +119,11 @@ class MatchSimulator:
         if len(strategy_names) != len(self.player_names):
             raise ValueError("Number of strategies must match number of players")
         self.strategy_names = strategy_names
+        # Built once and reused by every match; TriominoGame rebinds them via set_game
+        self._strategies: List[AIStrategy] = [get_strategy(name) for name in strategy_names]
         self.log_enabled = log_enabled
         self.log_dir = log_dir
+        self.workers = workers
         
         self.stats = MatchStats()
         self.results: List[MatchResult] = []
@@ -126,25 +146,18 @@ class MatchSimulator:
         Returns:
             MatchResult with game data
         """
-        start_time = time.time()
-        turns_count = 0
+        start_ns = time.perf_counter_ns()
         
-        strategies: List[AIStrategy] = [get_strategy(name) for name in self.strategy_names]
         game = TriominoGame(
             player_names=self.player_names,
             target_score=self.target_score,
             seed=seed,
-            strategies=strategies
+            strategies=self._strategies
         )
         
         # Set up callbacks
-        def on_turn(turn: TurnResult):
-            nonlocal turns_count
-            turns_count += 1
-            if self.on_turn:
-                self.on_turn(match_number, turn)
-        
-        game._on_turn_complete = on_turn
+        if self.on_turn:
+            game._on_turn_complete = lambda t: self.on_turn(match_number, t)
         
         if self.on_round_end:
             game._on_round_complete = lambda r: self.on_round_end(match_number, r)
@@ -152,15 +165,18 @@ class MatchSimulator:
         if self.on_match_start:
             self.on_match_start(match_number, game)
         
-        # Play the game
-        result = game.play_game()
+        # Play the game; without per-turn or per-round hooks the callback-free loop will do
+        if self.on_turn or self.on_round_end:
+            result = game.play_game()
+        else:
+            result = game.play_game_fast()
         
-        duration = time.time() - start_time
+        duration_ns = time.perf_counter_ns() - start_ns
         
         match_result = MatchResult(
             game_result=result,
-            duration_seconds=duration,
-            turns_played=turns_count
+            duration_ns=duration_ns,
+            turns_played=game.turns_played
         )
         
         if self.on_match_end:
@@ -188,35 +204,53 @@ class MatchSimulator:
         print(f"Target score: {self.target_score} points")
         print("-" * 50)
         
-        for i in range(self.num_matches):
-            match_num = i + 1
-            seed = (base_seed + i) if base_seed else None
-            
-            print(f"\n🎯 Match {match_num}/{self.num_matches}...")
-            
-            result = self.run_single_match(match_num, seed)
-            self.results.append(result)
-            self.stats.update_from_game(result.game_result)
-            
-            # Print match result
-            winner = result.game_result.winner.name
-            scores = result.game_result.final_scores
-            rounds = result.game_result.rounds_played
-            
-            print(f"   Winner: {winner}")
-            print(f"   Rounds: {rounds}")
-            print(f"   Scores: {scores}")
-            print(f"   Duration: {result.duration_seconds:.2f}s")
+        tasks = [(i + 1, (base_seed + i) if base_seed else None)
+                 for i in range(self.num_matches)]
+        workers = min(self.workers or os.cpu_count() or 1, len(tasks))
+        # Callbacks can't cross process boundaries, so those runs stay serial
+        has_callbacks = any((self.on_match_start, self.on_match_end, self.on_round_start,
+                             self.on_round_end, self.on_turn))
+        
+        if visualize or has_callbacks or workers <= 1:
+            for match_num, seed in tasks:
+                print(f"\n🎯 Match {match_num}/{self.num_matches}...")
+                self._record_result(self.run_single_match(match_num, seed))
+        else:
+            settings = (self.player_names, self.target_score, self.strategy_names)
+            chunksize = max(1, len(tasks) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_run_match, [settings + task for task in tasks],
+                                       chunksize=chunksize)
+                for (match_num, _), result in zip(tasks, results):
+                    print(f"\n🎯 Match {match_num}/{self.num_matches}...")
+                    self._record_result(result)
         
         self.stats.print_summary()
         if self.log_enabled:
             self._write_log(base_seed)
         return self.stats
 
+    def _record_result(self, result: MatchResult) -> None:
+        """Add a finished match to the stats and print its summary."""
+        self.results.append(result)
+        self.stats.update_from_game(result.game_result)
+        
+        # Print match result
+        winner = result.game_result.winner.name
+        scores = result.game_result.final_scores
+        rounds = result.game_result.rounds_played
+        
+        print(f"   Winner: {winner}")
+        print(f"   Rounds: {rounds}")
+        print(f"   Scores: {scores}")
+        print(f"   Duration: {result.duration_seconds:.2f}s")
+
     def _write_log(self, base_seed: Optional[int]) -> None:
         """Persist run stats to disk as JSON."""
+        # One clock read keeps the timestamp and the filename in agreement
+        now = datetime.now(timezone.utc)
         payload = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": now.isoformat().replace("+00:00", "Z"),
             "matches": self.num_matches,
             "base_seed": base_seed,
             "players": self.player_names,
@@ -243,9 +277,17 @@ class MatchSimulator:
 
         log_path = Path(self.log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
-        filename = f"run-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
-        with (log_path / filename).open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=True)
+        filename = f"run-{now.strftime('%Y%m%d-%H%M%S')}.json"
+        # Compact and unescaped: emoji player names stay as UTF-8, not \uXXXX pairs
+        (log_path / filename).write_bytes(json_dumps(payload))
+
+
+def _run_match(task: Tuple[List[str], int, List[str], int, Optional[int]]) -> MatchResult:
+    """Worker entry point: play one match without callbacks."""
+    player_names, target_score, strategy_names, match_number, seed = task
+    sim = MatchSimulator(num_matches=1, player_names=player_names,
+                         target_score=target_score, strategy_names=strategy_names)
+    return sim.run_single_match(match_number, seed)
 
 
 def quick_simulation(num_matches: int = 5, seed: int = None) -> MatchStats:
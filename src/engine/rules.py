@@ -47,10 +47,19 @@ INITIAL_TILES_2_PLAYERS = 9
 INITIAL_TILES_3_4_PLAYERS = 7
 INITIAL_TILES_5_6_PLAYERS = 6
 
+# Starting hand size by player count
+_INITIAL_TILES = {
+    2: INITIAL_TILES_2_PLAYERS,
+    3: INITIAL_TILES_3_4_PLAYERS,
+    4: INITIAL_TILES_3_4_PLAYERS,
+    5: INITIAL_TILES_5_6_PLAYERS,
+    6: INITIAL_TILES_5_6_PLAYERS,
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoreEvent:
-    """A scoring event that occurred during the game."""
+    """A scoring event that occurred during the game (immutable, so it can be shared)."""
     score_type: ScoreType
     points: int
     description: str
@@ -62,14 +71,10 @@ class ScoreEvent:
 
 def get_initial_tile_count(num_players: int) -> int:
     """Get number of tiles each player starts with based on player count."""
-    if num_players == 2:
-        return INITIAL_TILES_2_PLAYERS
-    elif num_players in (3, 4):
-        return INITIAL_TILES_3_4_PLAYERS
-    elif num_players in (5, 6):
-        return INITIAL_TILES_5_6_PLAYERS
-    else:
+    count = _INITIAL_TILES.get(num_players)
+    if count is None:
         raise ValueError(f"Invalid player count: {num_players}")
+    return count
 
 
 def calculate_opening_score(tile_value: int, is_triple: bool, 
@@ -244,7 +249,8 @@ def calculate_blocked_win_bonus(winner_hand_value: int,
     Returns:
         Tuple of (bonus, ScoreEvent)
     """
-    total_difference = sum(opp - winner_hand_value for opp in opponent_hand_values)
+    # Sum of (opp - winner) over opponents, without a per-opponent generator
+    total_difference = sum(opponent_hand_values) - winner_hand_value * len(opponent_hand_values)
     
     return (total_difference, ScoreEvent(
         ScoreType.BLOCKED_WIN,
@@ -48,22 +48,46 @@ BACKGROUNDS = {
 # Grid settings for Night mode
 GRID_COLOR = (100, 80, 140, 60)  # Translucent purple
 
+# Rendered gradients by (width, height, outer, inner); small, since only the
+# current window size and background are ever needed
+_GRADIENT_CACHE = {}
+_GRADIENT_CACHE_SIZE = 8
+
 def draw_gradient_background(surface, outer_color, inner_color):
-    """Draw a radial gradient from center (inner) to edges (outer)."""
-    import pygame
+    """Draw a radial gradient from center (inner) to edges (outer).
+
+    The gradient is rendered once per window size and color pair, then blitted.
+    """
+    w, h = surface.get_size()
+    key = (w, h, tuple(outer_color), tuple(inner_color))
+    gradient = _GRADIENT_CACHE.get(key)
+    if gradient is None:
+        if len(_GRADIENT_CACHE) >= _GRADIENT_CACHE_SIZE:
+            _GRADIENT_CACHE.clear()
+        # Same pixel format as the target, so the per-frame blit is a plain copy
+        gradient = pygame.Surface((w, h), 0, surface)
+        _render_gradient(gradient, outer_color, inner_color)
+        _GRADIENT_CACHE[key] = gradient
+    surface.blit(gradient, (0, 0))
+
+def _render_gradient(surface, outer_color, inner_color):
+    """Fill surface with the radial gradient, computed per pixel with numpy."""
+    import numpy as np
     w, h = surface.get_size()
     cx, cy = w // 2, h // 2
     max_radius = int((w**2 + h**2) ** 0.5 / 2) + 50
     
-    # Create gradient by drawing concentric circles
-    for r in range(max_radius, 0, -4):
-        t = r / max_radius
-        color = (
-            int(outer_color[0] * t + inner_color[0] * (1 - t)),
-            int(outer_color[1] * t + inner_color[1] * (1 - t)),
-            int(outer_color[2] * t + inner_color[2] * (1 - t)),
-        )
-        pygame.draw.circle(surface, color, (cx, cy), r)
+    # Distance of every pixel from the center, indexed [x, y] like surfarray
+    xx, yy = np.ogrid[:w, :h]
+    dist = np.sqrt((xx - cx) ** 2 + (yy - cy) ** 2)
+    # Snap to the 4px rings the gradient has always been drawn with: each
+    # pixel takes the smallest ring radius that still reaches it
+    r = np.maximum(max_radius - 4 * np.floor((max_radius - dist) / 4), max_radius % 4 or 4)
+    t = (r / max_radius)[..., np.newaxis]
+    outer = np.asarray(outer_color[:3], dtype=np.float64)
+    inner = np.asarray(inner_color[:3], dtype=np.float64)
+    pixels = (outer * t + inner * (1 - t)).astype(np.uint8)
+    pygame.surfarray.blit_array(surface, pixels)
 
 PLAYER_COLORS = THEMES["Classic"] # Default legacy for direct access if needed
 
@@ -105,3 +129,14 @@ class Assets:
             if path:
                 return path
         return None
+
+
+# Singleton instance
+_assets = None
+
+def get_assets() -> Assets:
+    """Get or create the shared Assets (fonts are loaded once per process)."""
+    global _assets
+    if _assets is None:
+        _assets = Assets()
+    return _assets
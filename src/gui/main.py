@@ -13,7 +13,6 @@ from src.engine.game import TriominoGame, TurnResult
 from src.engine.rules import calculate_pass_penalty, calculate_draw_failure_penalty
 from src.ai.strategies import get_strategy, AIStrategy, ScoredMove
 from src.gui.assets import (
-    Assets,
     DARK_BG,
     WHITE,
     BLACK,
@@ -27,6 +26,7 @@ from src.gui.assets import (
     UI_PANEL_LIGHT,
     UI_TEXT_MUTED,
     draw_gradient_background,
+    get_assets,
 )
 from src.gui.pygame_board import PygameBoard
 from src.gui.sound_engine import get_sound_engine
@@ -211,7 +211,7 @@ class TriominoApp:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Triominó")
         self.clock = pygame.time.Clock()
-        self.assets = Assets()
+        self.assets = get_assets()
         self._setup_logging()
         
         # State Management
@@ -239,6 +239,8 @@ class TriominoApp:
         
         # Game Objects (Init later)
         self.game = None
+        # Per seat: is that player's strategy a HumanStrategy (fixed per game)
+        self.human_seats = []
         self.board_view = None
         self.game_ui_buttons = []
         self.btn_quit = None
@@ -414,6 +416,7 @@ class TriominoApp:
             strategies=[strat1, strat2],
             seed=random.randint(1, 10000)
         )
+        self.human_seats = [isinstance(s, HumanStrategy) for s in self.game.strategies]
         self.game.setup_round()
         self.logger.info("Game start mode=%s p1=%s p2=%s theme=%s bg=%s",
                          self.game_mode, p1_name, p2_name, self.selected_theme, self.selected_bg_name)
@@ -466,6 +469,7 @@ class TriominoApp:
             strategies=[strat1, strat2],
             seed=random.randint(1, 10000)
         )
+        self.human_seats = [isinstance(s, HumanStrategy) for s in self.game.strategies]
         self.game.setup_round()
         self.game.play_opening()
         self.game.next_player()
@@ -485,7 +489,7 @@ class TriominoApp:
         if self.draws_made >= 3:
             self.message = "Max draws (3) reached! You must Pass."
             return
-        if len(self.game.pool) == 0:
+        if self.game.pool_remaining == 0:
             self.message = "Pool empty!"
             return
         
@@ -495,7 +499,7 @@ class TriominoApp:
         self.selected_tile_idx = None
         self.valid_ghosts = []
         self.logger.info("Draw tile: player=%s draws_made=%s pool=%s",
-                         self.game.current_player.name, self.draws_made, len(self.game.pool))
+                         self.game.current_player.name, self.draws_made, self.game.pool_remaining)
 
     def action_pass(self):
         if not self.is_human_turn(): return
@@ -505,7 +509,7 @@ class TriominoApp:
             self.message = "You must play if you can."
             return
         # Rule: Must draw 3 times before passing, UNLESS pool is empty
-        if self.draws_made < 3 and len(self.game.pool) > 0:
+        if self.draws_made < 3 and self.game.pool_remaining > 0:
             self.message = f"Draw 3 times before passing! ({3 - self.draws_made} left)"
             return
 
@@ -528,7 +532,7 @@ class TriominoApp:
 
     def is_human_turn(self):
         if not self.game: return False
-        return isinstance(self.game.strategies[self.game.current_player_idx], HumanStrategy)
+        return self.human_seats[self.game.current_player_idx]
 
     def audio_feedback_click(self):
         """Placeholder for click sound."""
@@ -583,7 +587,7 @@ class TriominoApp:
 
         self.game.next_player()
 
-        next_is_human = isinstance(self.game.strategies[self.game.current_player_idx], HumanStrategy)
+        next_is_human = self.human_seats[self.game.current_player_idx]
         
         if self.game_mode == "PvP":
              self.game_state = "HOTSEAT_WAIT"
@@ -969,7 +973,7 @@ class TriominoApp:
         self.screen.blit(self.assets.font_score.render(f"{p2.score}", True, p2_col), (p2_x + 45, 32))
         
         # Pool + Message
-        pool_txt = self.assets.font_main.render(f"Pool: {len(self.game.pool)}", True, UI_TEXT_MUTED)
+        pool_txt = self.assets.font_main.render(f"Pool: {self.game.pool_remaining}", True, UI_TEXT_MUTED)
         self.screen.blit(pool_txt, pool_txt.get_rect(midright=(WIDTH - 20, HUD_HEIGHT // 2)))
         msg_txt = self.assets.font_main.render(self._truncate_text(self.message, self.assets.font_main, 300), True, HIGHLIGHT_COLOR)
         self.screen.blit(msg_txt, msg_txt.get_rect(center=(WIDTH // 2 + 50, HUD_HEIGHT // 2)))
@@ -981,14 +985,14 @@ class TriominoApp:
             # DRAW button
             can_play = self.game.can_player_move(self.game.current_player)
             orig_draw = self.btn_draw.base_color
-            if can_play or self.draws_made >= 3 or len(self.game.pool) == 0:
+            if can_play or self.draws_made >= 3 or self.game.pool_remaining == 0:
                 self.btn_draw.base_color = (80, 80, 80)
             self.btn_draw.draw(self.screen, self.assets.font_main)
             self.btn_draw.base_color = orig_draw
             
             # PASS button
             orig_pass = self.btn_pass.base_color
-            can_pass = (not can_play) and (self.draws_made >= 3 or len(self.game.pool) == 0)
+            can_pass = (not can_play) and (self.draws_made >= 3 or self.game.pool_remaining == 0)
             if not can_pass:
                 self.btn_pass.base_color = (80, 80, 80)
             self.btn_pass.draw(self.screen, self.assets.font_main)
@@ -1104,14 +1108,13 @@ class TriominoApp:
         placements = self.game.board.find_valid_placements(tile)
         self.message = f"Tile {tile.values}: {len(placements)} valid spots"
         for i, p in enumerate(placements):
-            t_copy = tile.copy()
-            t_copy.rotation = p.rotation
             ghost = PlacedTile(
-                tile=t_copy,
+                tile=tile,
                 q=p.row,
                 r=p.col,
                 player_id=self.game.current_player_idx,
-                orientation=p.orientation
+                orientation=p.orientation,
+                rotation=p.rotation
             )
             self.valid_ghosts.append((ghost, i+1, p))
 
@@ -8,9 +8,11 @@ from __future__ import annotations
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import random
 import numpy as np
 
-from .tile import Triomino, PlacedTile, Edge
+from .tile import Triomino, PlacedTile, Edge, edge_bit
 
 
 class BonusType(Enum):
@@ -41,7 +43,7 @@ class PlacementResult:
         return self.hexagon_count > 0
 
 
-@dataclass 
+@dataclass(slots=True)
 class ValidPlacement:
     row: int
     col: int
@@ -50,6 +52,11 @@ class ValidPlacement:
     edges_matched: int
     bridge_count: int = 0
     hexagon_count: int = 0
+    bonus_points: int = field(init=False)
+
+    def __post_init__(self):
+        # Computed once here so move ranking doesn't redo it per comparison
+        self.bonus_points = (self.bridge_count * 40) + (self.hexagon_count * 50)
     
     @property
     def position(self) -> Tuple[int, int, str]:
@@ -101,10 +108,33 @@ def get_edges(vertices: np.ndarray) -> Set[frozenset]:
     return edges
 
 
+# Random 64-bit keys per (position, vertex values), drawn on first use
+_ZOBRIST_RANDOM = random.Random(0x7121)
+_ZOBRIST_KEYS: Dict[Tuple[Tuple[int, int, str], Tuple[int, int, int]], int] = {}
+
+
+def zobrist_key(pos: Tuple[int, int, str], values: Tuple[int, int, int]) -> int:
+    """Zobrist key for a tile with the given vertex values at a position."""
+    key = _ZOBRIST_KEYS.get((pos, values))
+    if key is None:
+        key = _ZOBRIST_KEYS[(pos, values)] = _ZOBRIST_RANDOM.getrandbits(64)
+    return key
+
+
+# Edge bitboard of an empty board: any tile may open
+_ALL_EDGES = (1 << 36) - 1
+
+
 def _round_vertex(pt: Tuple[float, float]) -> Tuple[float, float]:
     return (round(pt[0], 5), round(pt[1], 5))
 
 
+# Rounded vertices per position; pure geometry, so shared by every board
+_VERTEX_KEYS: Dict[Tuple[int, int, str], List[Tuple[float, float]]] = {}
+# Edge-sharing neighbors per position; geometry too, so shared the same way
+_NEIGHBORS: Dict[Tuple[int, int, str], List[Tuple[int, int, str]]] = {}
+
+
 def triangles_are_adjacent(pos1: Tuple[int, int, str], 
                             pos2: Tuple[int, int, str]) -> bool:
     """
@@ -119,6 +149,7 @@ def triangles_are_adjacent(pos1: Tuple[int, int, str],
     return len(shared) == 1
 
 
+@lru_cache(maxsize=None)
 def get_shared_edge_index(pos1: Tuple[int, int, str], 
                            pos2: Tuple[int, int, str]) -> Optional[Tuple[int, int]]:
     """
@@ -153,8 +184,52 @@ class GameBoard:
     def __init__(self):
         self.tiles: Dict[Tuple[int, int, str], PlacedTile] = {}
         self._move_history: List[PlacedTile] = []
-        self._adjacency_cache: Dict[Tuple[int, int, str], List[Tuple[int, int, str]]] = {}
+        self._adjacency_cache = _NEIGHBORS
+        # Bumped on every placement so callers can cache per board state
+        self.version: int = 0
+        # (min_row, max_row, min_col, max_col), grown as tiles are placed
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+        # XOR of zobrist_key over placed tiles: equal boards hash equal
+        self._zobrist: int = 0
+        # Per open position, edge_bit mask of the edges a tile there must show
+        self._open_edges: Dict[Tuple[int, int, str], int] = {}
+        # OR of _open_edges: a tile whose edge_mask misses it cannot be placed
+        self._edge_bitboard: int = _ALL_EDGES
+        # find_valid_placements results for this board state, by tile base values
+        self._placement_cache: Dict[Tuple[int, int, int], List[ValidPlacement]] = {}
+        # Vertex key -> (placed tile, local vertex index), in placement order
+        self._vertex_index: Dict[Tuple[float, float], Tuple[Tuple[PlacedTile, int], ...]] = {}
     
+    def _record_placement(self, pos: Tuple[int, int, str], placed: PlacedTile) -> None:
+        """Store a placed tile and update the derived board state."""
+        self.tiles[pos] = placed
+        self._move_history.append(placed)
+        self.version += 1
+        self._placement_cache = {}
+        self._zobrist ^= zobrist_key(pos, placed.values)
+        vertex_index = self._vertex_index
+        for idx, vertex in enumerate(self._get_vertices_key(*pos)):
+            vertex_index[vertex] = vertex_index.get(vertex, ()) + ((placed, idx),)
+        row, col, _ = pos
+        if self._bounds is None:
+            self._bounds = (row, row, col, col)
+        else:
+            min_row, max_row, min_col, max_col = self._bounds
+            self._bounds = (min(min_row, row), max(max_row, row),
+                            min(min_col, col), max(max_col, col))
+
+        open_edges = self._open_edges
+        open_edges.pop(pos, None)
+        for neighbor in self.get_neighbors(*pos):
+            if neighbor in self.tiles:
+                continue
+            edge = placed.get_edge(get_shared_edge_index(pos, neighbor)[0])
+            open_edges[neighbor] = open_edges.get(neighbor, 0) | edge_bit(edge.v1, edge.v2)
+        bitboard = 0
+        for mask in open_edges.values():
+            bitboard |= mask
+        self._edge_bitboard = bitboard
+
     def is_empty(self) -> bool:
         return len(self.tiles) == 0
     
@@ -230,18 +305,16 @@ class GameBoard:
 
     def _get_vertices_key(self, row: int, col: int, orientation: str) -> List[Tuple[float, float]]:
         """Return rounded vertices for a given position in the grid."""
-        vertices = get_triangle_vertices(row, col, orientation)
-        return [_round_vertex((vx, vy)) for vx, vy in vertices]
+        pos = (row, col, orientation)
+        keys = _VERTEX_KEYS.get(pos)
+        if keys is None:
+            vertices = get_triangle_vertices(row, col, orientation)
+            keys = _VERTEX_KEYS[pos] = [_round_vertex((vx, vy)) for vx, vy in vertices]
+        return keys
 
-    def _iter_tiles_with_vertex(self, vertex: Tuple[float, float]) -> List[Tuple[PlacedTile, int]]:
+    def _iter_tiles_with_vertex(self, vertex: Tuple[float, float]) -> Tuple[Tuple[PlacedTile, int], ...]:
         """Return all placed tiles that include the given vertex (with local vertex index)."""
-        matches: List[Tuple[PlacedTile, int]] = []
-        for pos, placed in self.tiles.items():
-            verts = self._get_vertices_key(*pos)
-            for idx, v in enumerate(verts):
-                if v == vertex:
-                    matches.append((placed, idx))
-        return matches
+        return self._vertex_index.get(vertex, ())
 
     def _count_tiles_at_vertex(self, vertex: Tuple[float, float]) -> int:
         """Count how many placed tiles share a given vertex."""
@@ -301,11 +374,39 @@ class GameBoard:
                     return False
         return True
     
+    @property
+    def edge_bitboard(self) -> int:
+        """Directed edges (edge_bit) exposed to open positions."""
+        return self._edge_bitboard
+
     def find_valid_placements(self, tile: Triomino) -> List[ValidPlacement]:
-        """Find all valid positions and rotations for a tile."""
+        """
+        Find all valid positions and rotations for a tile.
+
+        Results are memoized until the next placement. Rotations of a tile
+        share one placement set, so they are keyed by the tile's base values.
+        The returned list is shared and must not be modified.
+        """
+        key = tile.base_values
+        placements = self._placement_cache.get(key)
+        if placements is None:
+            placements = self._placement_cache[key] = self._search_placements(tile)
+        return placements
+
+    def _search_placements(self, tile: Triomino) -> List[ValidPlacement]:
+        """Enumerate valid positions and rotations for a tile (uncached)."""
         valid = []
+        edge_mask = tile.edge_mask
+        if not edge_mask & self._edge_bitboard:
+            return valid
         
+        # Rotate a private copy; the caller's tile may be a shared deck object
+        tile = tile.copy(0)
         for pos in self.get_open_positions():
+            # Every exposed edge around pos must be one of the tile's edges
+            required = self._open_edges.get(pos, 0)
+            if edge_mask & required != required:
+                continue
             row, col, orientation = pos
             adjacent = self.get_adjacent_tiles(row, col, orientation)
             
@@ -339,7 +440,6 @@ class GameBoard:
                         hexagon_count=hexagon_count
                     ))
         
-        tile.rotation = 0
         return valid
     
     def place_tile(self, tile: Triomino, row: int, col: int, orientation: str,
@@ -350,12 +450,15 @@ class GameBoard:
         if pos in self.tiles:
             return PlacementResult(success=False, message="Position occupied")
         
+        # Rotate a copy: hand tiles are shared deck objects and stay at rotation 0
+        tile = tile.copy()
+        tile.rotation = rotation
+        
         if not self.is_empty():
             adjacent = self.get_adjacent_tiles(row, col, orientation)
             if not adjacent:
                 return PlacementResult(success=False, message="Not adjacent to any tile")
             
-            tile.rotation = rotation
             for adj_pos, adj_tile in adjacent.items():
                 if not self._check_edge_match(tile, pos, adj_tile, adj_pos):
                     return PlacementResult(success=False, message="Edges don't match")
@@ -364,17 +467,15 @@ class GameBoard:
                 return PlacementResult(success=False, message="Vertex values don't match")
         
         # Valid placement
-        tile.rotation = rotation
         placed = PlacedTile(
-            tile=tile.copy(), 
+            tile=tile, 
             q=row,  # Using q for row
             r=col,  # Using r for col
             player_id=player_id,
             orientation=orientation
         )
         
-        self.tiles[pos] = placed
-        self._move_history.append(placed)
+        self._record_placement(pos, placed)
         
         # Calculate bonuses
         bridge_count, hexagon_count = self._evaluate_bonuses(tile, row, col, orientation)
@@ -415,8 +516,7 @@ class GameBoard:
             orientation='up'
         )
         
-        self.tiles[pos] = placed
-        self._move_history.append(placed)
+        self._record_placement(pos, placed)
         
         base_points = tile.sum_value
         bonus_points = 0
@@ -434,6 +534,30 @@ class GameBoard:
             message=f"First tile: {tile}"
         )
     
+    def copy(self) -> GameBoard:
+        """
+        Copy the board for hypothetical play (e.g. search).
+
+        Placed tiles are never mutated, so they are shared; the adjacency
+        cache depends only on geometry and is shared as well.
+        """
+        board = GameBoard.__new__(GameBoard)
+        board.tiles = dict(self.tiles)
+        board._move_history = list(self._move_history)
+        board._adjacency_cache = self._adjacency_cache
+        board.version = self.version
+        board._bounds = self._bounds
+        board._zobrist = self._zobrist
+        board._open_edges = dict(self._open_edges)
+        board._edge_bitboard = self._edge_bitboard
+        board._vertex_index = dict(self._vertex_index)
+        board._placement_cache = dict(self._placement_cache)
+        return board
+
+    def zobrist_hash(self) -> int:
+        """Order-independent hash of the placed tiles (position and values)."""
+        return self._zobrist
+    
     @property
     def tile_count(self) -> int:
         return len(self.tiles)
@@ -443,11 +567,10 @@ class GameBoard:
         return self._move_history.copy()
     
     def get_bounds(self) -> Tuple[int, int, int, int]:
-        if self.is_empty():
+        """(min_row, max_row, min_col, max_col) of placed tiles; O(1)."""
+        if self._bounds is None:
             return (7, 7, 7, 7)
-        rows = [pos[0] for pos in self.tiles.keys()]
-        cols = [pos[1] for pos in self.tiles.keys()]
-        return (min(rows), max(rows), min(cols), max(cols))
+        return self._bounds
     
     def __repr__(self) -> str:
         return f"GameBoard({len(self.tiles)} tiles)"
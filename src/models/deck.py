@@ -5,7 +5,7 @@ Creates the official 56-tile Triomino deck.
 Rules: Numbers 0-5, clockwise ascending order only (no mirrors).
 """
 from __future__ import annotations
-from typing import List
+from typing import List, Optional, Tuple
 import random
 
 from .tile import Triomino
@@ -39,13 +39,24 @@ def create_full_deck() -> List[Triomino]:
     return deck
 
 
-def create_shuffled_deck(seed: int | None = None) -> List[Triomino]:
-    """Create a shuffled deck, optionally with a fixed seed for reproducibility."""
-    if seed is not None:
-        random.seed(seed)
+# One set of tiles shared by every shuffled deck. The engine never rotates
+# hand tiles in place (placements rotate a copy), so sharing them is safe.
+_CANONICAL_DECK: Tuple[Triomino, ...] = tuple(create_full_deck())
+
+
+def create_shuffled_deck(seed: int | None = None,
+                         rng: Optional[random.Random] = None) -> List[Triomino]:
+    """
+    Create a shuffled deck, optionally with a fixed seed for reproducibility.
     
-    deck = create_full_deck()
-    random.shuffle(deck)
+    Shuffles with rng when given, else with a generator seeded from seed;
+    the global random module is never touched.
+    """
+    if rng is None:
+        rng = random.Random(seed)
+    
+    deck = list(_CANONICAL_DECK)
+    rng.shuffle(deck)
     return deck
 
 
@@ -4,7 +4,7 @@ Player Model
 Represents a player in the Triomino game with their hand and score.
 """
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from dataclasses import dataclass, field
 
 from .tile import Triomino
@@ -25,6 +25,13 @@ class Player:
     hand: List[Triomino] = field(default_factory=list)
     score: int = 0
     is_computer: bool = True
+    # Running sum of tile values in hand; kept in step by the methods below
+    _hand_value_sum: int = field(default=0, init=False, repr=False, compare=False)
+    # Bumped whenever the hand changes, so per-hand results can be cached
+    hand_version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._hand_value_sum = sum(t.sum_value for t in self.hand)
     
     def draw_tiles(self, deck: List[Triomino], count: int) -> List[Triomino]:
         """
@@ -43,8 +50,17 @@ class Player:
                 break
             tile = deck.pop()
             self.hand.append(tile)
+            self._hand_value_sum += tile.sum_value
             drawn.append(tile)
+        self.hand_version += 1
         return drawn
+
+    def add_tiles(self, tiles: Sequence[Triomino]) -> None:
+        """Add tiles already taken from the pool to the player's hand."""
+        self.hand.extend(tiles)
+        for tile in tiles:
+            self._hand_value_sum += tile.sum_value
+        self.hand_version += 1
     
     def play_tile(self, tile: Triomino) -> Optional[Triomino]:
         """
@@ -58,6 +74,8 @@ class Player:
         """
         for i, t in enumerate(self.hand):
             if t == tile:
+                self._hand_value_sum -= t.sum_value
+                self.hand_version += 1
                 return self.hand.pop(i)
         return None
     
@@ -68,7 +86,7 @@ class Player:
     @property
     def hand_value(self) -> int:
         """Sum of all tile values in hand."""
-        return sum(t.sum_value for t in self.hand)
+        return self._hand_value_sum
     
     @property
     def hand_size(self) -> int:
@@ -100,6 +118,8 @@ class Player:
     def reset_for_new_round(self) -> None:
         """Clear hand for a new round (score persists)."""
         self.hand.clear()
+        self._hand_value_sum = 0
+        self.hand_version += 1
     
     def __repr__(self) -> str:
         return f"Player({self.name}, score={self.score}, hand={len(self.hand)} tiles)"
@@ -5,8 +5,8 @@ Represents a single triangular tile with three vertex values (0-5).
 Handles rotation and edge matching logic.
 """
 from __future__ import annotations
-from typing import Tuple, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Tuple, List, Optional
+from dataclasses import InitVar, dataclass
 
 
 @dataclass(frozen=True)
@@ -31,6 +31,20 @@ class Edge:
         return f"({self.v1}-{self.v2})"
 
 
+# Dense id 0..55 per tile, by sorted values in deck order (a <= b <= c)
+_CANONICAL_IDS: Dict[Tuple[int, int, int], int] = {
+    (a, b, c): i
+    for i, (a, b, c) in enumerate(
+        (a, b, c) for a in range(6) for b in range(a, 6) for c in range(b, 6)
+    )
+}
+
+
+def edge_bit(v1: int, v2: int) -> int:
+    """Bit for the directed edge (v1, v2) in a 36-bit edge mask."""
+    return 1 << (v1 * 6 + v2)
+
+
 class Triomino:
     """
     A triangular tile with three vertex values.
@@ -59,6 +73,10 @@ class Triomino:
         # Store base values (immutable)
         self._base: Tuple[int, int, int] = (a, b, c)
         self._rotation: int = 0
+        # Same id for any ordering of the values, like __eq__; used as the hash
+        self.canonical_id: int = _CANONICAL_IDS[tuple(sorted(self._base))]
+        # Directed edges this tile can show; rotating only cycles them
+        self.edge_mask: int = edge_bit(a, b) | edge_bit(b, c) | edge_bit(c, a)
     
     @property
     def values(self) -> Tuple[int, int, int]:
@@ -72,6 +90,11 @@ class Triomino:
         else:  # r == 2
             return (b, c, a)  # 240° clockwise
 
+    @property
+    def base_values(self) -> Tuple[int, int, int]:
+        """Vertex values at rotation 0 (independent of the current rotation)."""
+        return self._base
+
     def get_values(self, orientation: str = "up") -> Tuple[int, int, int]:
         """
         Get vertex values considering rotation.
@@ -100,10 +123,14 @@ class Triomino:
         self._rotation = (self._rotation + steps) % 3
         return self
     
-    def copy(self) -> Triomino:
-        """Create a copy of this tile with the same rotation."""
-        t = Triomino(*self._base)
-        t._rotation = self._rotation
+    def copy(self, rotation: Optional[int] = None) -> Triomino:
+        """Create a copy of this tile, with the same rotation unless one is given."""
+        # Values were validated when self was built, so skip __init__
+        t = Triomino.__new__(Triomino)
+        t._base = self._base
+        t._rotation = self._rotation if rotation is None else rotation % 3
+        t.edge_mask = self.edge_mask
+        t.canonical_id = self.canonical_id
         return t
     
     def get_edge(self, edge_index: int, orientation: str = "up") -> Edge:
@@ -166,11 +193,11 @@ class Triomino:
         """Two tiles are equal if they have the same base values (ignoring rotation)."""
         if not isinstance(other, Triomino):
             return False
-        # Compare sorted base values to handle different orderings
-        return sorted(self._base) == sorted(other._base)
+        # canonical_id is shared by every ordering of the same values
+        return self.canonical_id == other.canonical_id
     
     def __hash__(self) -> int:
-        return hash(tuple(sorted(self._base)))
+        return self.canonical_id
     
     def __repr__(self) -> str:
         v = self.values
@@ -189,17 +216,19 @@ class PlacedTile:
     
     IMPORTANT: The tile is copied at construction time to freeze its rotation.
     This prevents corruption when the original tile's rotation changes during
-    subsequent move searches.
+    subsequent move searches. Pass `rotation` to place the copy at that
+    rotation without touching the original tile.
     """
     tile: Triomino
     q: int  # Row in new system
     r: int  # Col in new system
     player_id: Optional[int] = None
     orientation: str = 'up'  # 'up' or 'down'
+    rotation: InitVar[Optional[int]] = None
     
-    def __post_init__(self):
-        # Make a copy of the tile to freeze its current rotation state
-        self.tile = self.tile.copy()
+    def __post_init__(self, rotation: Optional[int]):
+        # Make a copy of the tile to freeze its current (or given) rotation
+        self.tile = self.tile.copy(rotation)
     
     @property
     def row(self) -> int:
@@ -152,8 +152,7 @@ class TriominoEnv(gym.Env):
                     # Valid move - Greedy placement logic
                     def calculate_greedy_score(tile, p):
                         # Create temporary copy to get values with correct rotation
-                        t_copy = tile.copy()
-                        t_copy.rotation = p.rotation
+                        t_copy = tile.copy(p.rotation)
                         score = sum(t_copy.values)
                         if p.bridge_count > 0: score += 40
                         if p.hexagon_count > 0: score += 50
@@ -230,7 +229,7 @@ class TriominoEnv(gym.Env):
         # Can you draw if you CAN play? Often yes (strategic).
         # We allow it unless max draws reached.
         # MAX_DRAWS usually 3.
-        if len(self.game.pool) > 0 and self.draws_current_turn < 3 and not can_play_any:
+        if self.game.pool_remaining > 0 and self.draws_current_turn < 3 and not can_play_any:
              mask[self.DRAW_ACTION] = True
              
         # 3. Pass action
@@ -239,7 +238,7 @@ class TriominoEnv(gym.Env):
         # B) Draws == 3 AND no moves
         # Basically: If you can't play and can't draw (or drew max).
         
-        cant_draw = (len(self.game.pool) == 0) or (self.draws_current_turn >= 3)
+        cant_draw = (self.game.pool_remaining == 0) or (self.draws_current_turn >= 3)
         
         if not can_play_any and cant_draw:
              mask[self.PASS_ACTION] = True
@@ -302,7 +301,7 @@ class TriominoEnv(gym.Env):
         state = np.array([
             player.score / 400.0,
             self.game.players[1].score / 400.0,
-            len(self.game.pool) / 56.0,
+            self.game.pool_remaining / 56.0,
             len(player.hand) / 20.0,
             len(self.game.players[1].hand) / 20.0,
             0.0 # draws left (omitted for now)
@@ -224,7 +224,7 @@ class GameRenderer:
             y -= lh * 1.2
         
         y -= lh * 0.5
-        self.ax_info.text(0.5, y, f"Pool: {len(game.pool)} tiles", fontsize=10,
+        self.ax_info.text(0.5, y, f"Pool: {game.pool_remaining} tiles", fontsize=10,
                           ha='center', transform=self.ax_info.transAxes, color='#f0f0f0')
         
         if last_turn and last_turn.points_earned != 0:
@@ -52,6 +52,36 @@ def triangle_vertices(q: int, r: int) -> List[Tuple[float, float]]:
     return [v0_coord, v1_coord, v2_coord]
 
 
+# Inward text offsets for the three vertex labels, per orientation.
+# The offset from a vertex towards the triangle centre does not depend on
+# (q, r), so it is computed once here instead of for every drawn piece.
+LABEL_INWARD_FACTOR = 0.25  # Fraction of SIZE to move each number inward (0 to 1)
+
+
+def _label_offsets(q: int, r: int) -> List[Tuple[float, float]]:
+    """Offsets (dx, dy) that move each vertex of cell (q, r) towards its centre."""
+    coords = triangle_vertices(q, r)
+    cx, cy = sum(v[0] for v in coords) / 3, sum(v[1] for v in coords) / 3
+    offsets = []
+    for x, y in coords:
+        vec_x, vec_y = x - cx, y - cy
+        vec_len = math.sqrt(vec_x**2 + vec_y**2)
+        if vec_len > 0:
+            norm_vec_x, norm_vec_y = vec_x / vec_len, vec_y / vec_len
+        else:
+            norm_vec_x, norm_vec_y = 0, 0 # Avoid division by zero for coincident points
+        offsets.append((-norm_vec_x * SIZE * LABEL_INWARD_FACTOR,
+                        -norm_vec_y * SIZE * LABEL_INWARD_FACTOR))
+    return offsets
+
+
+# True → ▲ (even q + r), False → ▼ (odd q + r)
+LABEL_OFFSETS: Dict[bool, List[Tuple[float, float]]] = {
+    True: _label_offsets(0, 0),
+    False: _label_offsets(0, 1),
+}
+
+
 # Helper: full official Triomino set (56 tiles, numbers 0‑5 without order)
 def full_deck() -> List["Triomino"]:
     """Generates a complete set of 56 unique Triomino tiles."""
@@ -141,9 +171,15 @@ def generate_demidegrama(seed: int | None = None,
 
     # 2. Find the highest triple (e.g., 5-5-5) to start the game
     # This ensures a consistent and valid starting point based on Triomino rules.
-    start = max([tri for tri in deck if tri.values[0] == tri.values[1] == tri.values[2]],
-                key=lambda t: t.values[0])
-    deck.remove(start) # Remove the starting tile from the deck
+    start_idx = max((k for k, tri in enumerate(deck) if tri.values[0] == tri.values[1] == tri.values[2]),
+                    key=lambda k: deck[k].values[0])
+    start = deck[start_idx]
+
+    # The deck order stays fixed; a tile leaves the pool by clearing its flag,
+    # which is O(1) instead of the O(n) shift of deck.remove().
+    in_pool = [True] * len(deck)
+    in_pool[start_idx] = False # Remove the starting tile from the pool
+    remaining = len(deck) - 1
 
     up_first = True  # Convention: the starting triple is an 'up' triangle (▲)
     # Initialize the list of placed pieces with the starting tile at (0,0)
@@ -161,8 +197,8 @@ def generate_demidegrama(seed: int | None = None,
     ]
 
     steps = 1 # Counter for the number of tiles placed
-    # Continue as long as we haven't reached max_steps and there are tiles left in the deck
-    while steps < max_steps and deck:
+    # Continue as long as we haven't reached max_steps and there are tiles left in the pool
+    while steps < max_steps and remaining:
         random.shuffle(frontier) # Randomly pick an open edge to try and place a tile
         progress_made = False # Flag to check if a tile was successfully placed in this step
 
@@ -180,8 +216,10 @@ def generate_demidegrama(seed: int | None = None,
             if (nq, nr) in occupied:
                 continue
 
-            # Search for a tile in the remaining deck that can match the 'need_pair'
-            for tri in deck:
+            # Search for a tile in the remaining pool that can match the 'need_pair'
+            for k, tri in enumerate(deck):
+                if not in_pool[k]:
+                    continue
                 for rot in range(3):
                     tri.rotate(rot)          # Rotate the tile in-place
                     neighbour_up = not host_up # The neighbor triangle will have the opposite orientation
@@ -198,7 +236,8 @@ def generate_demidegrama(seed: int | None = None,
                         new_piece = PlacedPiece(tri, nq, nr)
                         placed.append(new_piece)       # Add the new piece to the placed list
                         occupied[(nq, nr)] = new_piece # Mark the position as occupied
-                        deck.remove(tri)               # Remove the tile from the deck
+                        in_pool[k] = False             # Remove the tile from the pool
+                        remaining -= 1
 
                         # Add the three new open edges of the newly placed piece to the frontier
                         new_edge_data = edges_for(tri, neighbour_up)
@@ -345,35 +384,14 @@ def draw_demidegrama(pieces: List["PlacedPiece"], face: str = "#e10600", edge: s
         if draw_numbers: # Draw numbers on vertices
             # Get the values of the triomino in its current rotation
             tri_values = p.tri.values # (pointy_val, base_left_val, base_right_val)
-            # Get the Cartesian coordinates of the vertices
-            tri_coords = p.vertices() # [pointy_coord, base_left_coord, base_right_coord]
+            # Precomputed inward offsets keep the numbers inside the tile and readable
+            offsets = LABEL_OFFSETS[(p.q + p.r) % 2 == 0]
 
             # Place text for each vertex value
             for j in range(3):
-                x, y = tri_coords[j]
-                val = tri_values[j]
-                
-                # Adjust text position slightly towards the center of the triangle
-                # This ensures numbers are inside the tile and readable.
-                cx, cy = sum(v[0] for v in tri_coords)/3, sum(v[1] for v in tri_coords)/3
-                
-                # Calculate vector from center to vertex
-                vec_x, vec_y = x - cx, y - cy
-                
-                # Normalize vector and scale to move inward
-                vec_len = math.sqrt(vec_x**2 + vec_y**2)
-                if vec_len > 0:
-                    norm_vec_x, norm_vec_y = vec_x / vec_len, vec_y / vec_len
-                else:
-                    norm_vec_x, norm_vec_y = 0, 0 # Avoid division by zero for coincident points
-
-                # Move inward by a fraction of the distance from center to vertex
-                inward_offset_factor = 0.25 # Adjust this value (0 to 1) to control how far inward
-                
-                text_x = x - norm_vec_x * (SIZE * inward_offset_factor)
-                text_y = y - norm_vec_y * (SIZE * inward_offset_factor)
-
-                ax.text(text_x, text_y, str(val),
+                x, y = verts[j]
+                dx, dy = offsets[j]
+                ax.text(x + dx, y + dy, str(tri_values[j]),
                         color='white', fontsize=14, ha='center', va='center',
                         weight='bold')
 
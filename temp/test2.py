@@ -1,160 +1,475 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import random
-from matplotlib.patches import Polygon
-import time
-
-# 1) Parámetros de la grilla
-rows, cols = 15, 15
-side = 1
-h = np.sqrt(3)/2 * side
-
-print("Generando grilla...")
-
-# 2) Generar la grilla (la misma para todas las generaciones)
-coords_map = {}
-for i in range(rows):
-    for j in range(cols):
-        x0 = j*side + (i % 2)*(side/2)
-        y0 = i * h
-        # Triángulo "up" (apunta hacia arriba)
-        coords_map[(i, j, 'up')] = np.array([
-            (x0+side/2, y0),
-            (x0, y0+h),
-            (x0+side, y0+h)
-        ])
-        # Triángulo "down" (apunta hacia abajo)
-        coords_map[(i, j, 'down')] = np.array([
-            (x0, y0+h),
-            (x0+side/2, y0+2*h),
-            (x0+side, y0+h)
-        ])
-cell_ids = list(coords_map.keys())
-print(f"Total de triángulos en la grilla: {len(cell_ids)}")
-
-
-# Función para obtener las aristas de un triángulo (redondeando para evitar precisión)
-def get_edges(poly):
-    pts = [(round(pt[0], 5), round(pt[1], 5)) for pt in poly]
-    edges = []
-    for k in range(3):
-        edge = frozenset([pts[k], pts[(k+1) % 3]])
-        edges.append(edge)
-    return set(edges)
-
-# Crear mapa de aristas
-edges_map = {}
-for cid in cell_ids:
-    edges_map[cid] = get_edges(coords_map[cid])
-print("Mapa de aristas creado.")
-
-# 3) Construir grafo de adyacencia (dos triángulos vecinas si comparten una arista completa)
-adj = {cid: [] for cid in cell_ids}
-for i, cid1 in enumerate(cell_ids):
-    for cid2 in cell_ids[i+1:]:
-        if edges_map[cid1] & edges_map[cid2]:
-            adj[cid1].append(cid2)
-            adj[cid2].append(cid1)
-print("Grafo de adyacencia construido.")
-central_example = cell_ids[len(cell_ids)//2]
-print(f"Vecinos de {central_example}: {adj[central_example]}")
-
-# 4) Buscar candidatos a "triomino": Tres triángulos conectados por al menos 2 aristas
-triominos = set()
-for i, a in enumerate(cell_ids):
-    for b in adj[a]:
-        if b <= a:
-            continue
-        union_neighbors = set(adj[a]).union(adj[b])
-        for c in union_neighbors:
-            if c <= b:
+import pickle
+import io
+import multiprocessing as mp
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+try:  # Numba es opcional: sin ella se usa la versión con sets de Python
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Carpeta donde se guardan las grillas ya calculadas (una por (rows, cols, side))
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+# Subir cuando cambie el contenido de Grid, para no leer cachés viejos
+GRID_CACHE_VERSION = 3
+
+
+@dataclass
+class Grid:
+    """Grilla triangular con su grafo de adyacencia y los triominos candidatos."""
+    rows: int
+    cols: int
+    side: float
+    h: float
+    up_tris: np.ndarray    # (rows, cols, 3, 2)
+    down_tris: np.ndarray  # (rows, cols, 3, 2)
+    coords_map: dict
+    cell_ids: list
+    adj: dict
+    triominos: list
+    cell_to_triominos: dict
+    center: tuple
+    # Misma información con ids enteros de celda (índice en cell_ids), para el kernel
+    tri_cells: np.ndarray    # int32[M, 3]
+    # Adyacencia en formato CSR: los vecinos de la celda i son
+    # adj_indices[adj_indptr[i]:adj_indptr[i+1]] (un tramo contiguo)
+    adj_indptr: np.ndarray   # int32[N+1]
+    adj_indices: np.ndarray  # int32[E]
+
+
+def build_grid(rows, cols, side):
+    h = np.sqrt(3)/2 * side
+
+    print("Generando grilla...")
+
+    # 2) Generar la grilla (la misma para todas las generaciones)
+    # Se construyen todos los vértices de una vez: tensores (rows, cols, 3, 2)
+    ii, jj = np.meshgrid(np.arange(rows), np.arange(cols), indexing='ij')
+    x0 = jj*side + (ii % 2)*(side/2)
+    y0 = ii*h
+    # Triángulos "up" (apuntan hacia arriba)
+    up_tris = np.stack([
+        np.stack([x0+side/2, y0], axis=-1),
+        np.stack([x0, y0+h], axis=-1),
+        np.stack([x0+side, y0+h], axis=-1),
+    ], axis=-2)
+    # Triángulos "down" (apuntan hacia abajo)
+    down_tris = np.stack([
+        np.stack([x0, y0+h], axis=-1),
+        np.stack([x0+side/2, y0+2*h], axis=-1),
+        np.stack([x0+side, y0+h], axis=-1),
+    ], axis=-2)
+    # Vista compatible por celda (slices del tensor, sin copias)
+    coords_map = {}
+    for i in range(rows):
+        for j in range(cols):
+            coords_map[(i, j, 'up')] = up_tris[i, j]
+            coords_map[(i, j, 'down')] = down_tris[i, j]
+    cell_ids = list(coords_map.keys())
+    print(f"Total de triángulos en la grilla: {len(cell_ids)}")
+
+    # Los vértices caen sobre una red regular: x en múltiplos de side/2, y en múltiplos de h.
+    # Cada vértice de la red recibe un id entero, y cada arista se empaqueta como
+    # (min << 32) | max: comparar o hashear una arista es comparar un entero.
+    vertex_ids = {}
+
+    def vertex_id(pt):
+        key = (int(round(2*pt[0]/side)), int(round(pt[1]/h)))
+        vid = vertex_ids.get(key)
+        if vid is None:
+            vid = vertex_ids[key] = len(vertex_ids)
+        return vid
+
+    # Función para obtener las 3 aristas de un triángulo como claves enteras
+    def get_edges(poly):
+        ids = [vertex_id(pt) for pt in poly]
+        edges = []
+        for k in range(3):
+            a, b = ids[k], ids[(k+1) % 3]
+            if a > b:
+                a, b = b, a
+            edges.append((a << 32) | b)
+        return tuple(edges)
+
+    # Crear mapa de aristas
+    edges_map = {}
+    for cid in cell_ids:
+        edges_map[cid] = get_edges(coords_map[cid])
+    print("Mapa de aristas creado.")
+
+    # 3) Construir grafo de adyacencia (dos triángulos vecinas si comparten una arista completa)
+    # Una sola pasada: cada arista agrupa las celdas que la contienen
+    bucket = defaultdict(list)
+    for cid, edges in edges_map.items():
+        for e in edges:
+            bucket[e].append(cid)
+    adj = {cid: [] for cid in cell_ids}
+    for cells in bucket.values():
+        if len(cells) == 2:
+            a, b = cells
+            adj[a].append(b)
+            adj[b].append(a)
+    adj = {cid: tuple(neighbors) for cid, neighbors in adj.items()}
+    print("Grafo de adyacencia construido.")
+    central_example = cell_ids[len(cell_ids)//2]
+    print(f"Vecinos de {central_example}: {adj[central_example]}")
+
+    # 4) Buscar candidatos a "triomino": Tres triángulos conectados por al menos 2 aristas
+    # El tercer triángulo c cuelga de a o de b; el set deduplica las ternas ordenadas
+    triominos = set()
+    for a in cell_ids:
+        for b in adj[a]:
+            if b <= a:
                 continue
-            # La conectividad se comprueba si c está en vecinos de a o de b
-            if (c in adj[a]) or (c in adj[b]):
-                triominos.add((a, b, c))
-triominos = list(triominos)
-print(f"Número total de triominos candidatos: {len(triominos)}")
-
-# Función para verificar adyacencia (por lados) respecto al área ocupada
-def is_adjacent_to_occupied(triomino, occupied):
-    for cell in triomino:
-        for occ in occupied:
-            if cell in adj[occ]:
-                return True
-    return False
-
-# Parámetros para la animación de generaciones:
-max_fichas = 56      # Fichas por generación
-num_generaciones = 5 # Número de iteraciones de llenado
-
-# Preparamos la figura y eje una sola vez
-plt.ion()  # Modo interactivo
-fig, ax = plt.subplots(figsize=(10, 10))
-
-# Función para dibujar la grilla (fondo) en el eje
-def dibujar_grilla(ax):
-    ax.cla()  # Limpiar el eje
-    for cid, coords in coords_map.items():
-        poly = Polygon(coords, facecolor='none', edgecolor='darkgray', zorder=1, linewidth=0.5)
-        ax.add_patch(poly)
-    ax.set_aspect('equal')
-    ax.autoscale_view()
-    ax.axis('off')
-    plt.tight_layout()
+            for c in adj[a]:
+                if c > b:
+                    triominos.add((a, b, c))
+            for c in adj[b]:
+                if c > b:
+                    triominos.add((a, b, c))
+    triominos = list(triominos)
+    print(f"Número total de triominos candidatos: {len(triominos)}")
+
+    # Índice inverso celda -> triominos que la contienen (en orden de `triominos`)
+    cell_to_triominos = {cid: [] for cid in cell_ids}
+    for idx, t in enumerate(triominos):
+        for cell in t:
+            cell_to_triominos[cell].append(idx)
+
+    center = min(cell_ids, key=lambda cid: abs(cid[0]-rows/2) + abs(cid[1]-cols/2))
+
+    cell_index = {cid: k for k, cid in enumerate(cell_ids)}
+    tri_cells = np.array([[cell_index[c] for c in t] for t in triominos], dtype=np.int32)
+    # CSR: grado por celda -> suma acumulada en indptr, vecinos volcados en indices
+    degree = np.array([len(adj[cid]) for cid in cell_ids], dtype=np.int32)
+    adj_indptr = np.zeros(len(cell_ids) + 1, dtype=np.int32)
+    np.cumsum(degree, out=adj_indptr[1:])
+    adj_indices = np.array([cell_index[n] for cid in cell_ids for n in adj[cid]],
+                           dtype=np.int32)
+
+    return Grid(rows=rows, cols=cols, side=side, h=h,
+                up_tris=up_tris, down_tris=down_tris,
+                coords_map=coords_map, cell_ids=cell_ids, adj=adj,
+                triominos=triominos, cell_to_triominos=cell_to_triominos,
+                center=center, tri_cells=tri_cells,
+                adj_indptr=adj_indptr, adj_indices=adj_indices)
+
+
+def load_grid(rows, cols, side):
+    """Devuelve la grilla desde el caché en disco, o la construye y la guarda."""
+    cache_path = CACHE_DIR / f"grid_v{GRID_CACHE_VERSION}_{rows}x{cols}_{side}.pkl"
+    if cache_path.exists():
+        with cache_path.open("rb") as f:
+            grid = Grid(**pickle.load(f))
+        print(f"Grilla cargada desde {cache_path}")
+        return grid
+    grid = build_grid(rows, cols, side)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with tmp_path.open("wb") as f:
+        # Se guardan los campos (no la instancia) para poder leerlos también
+        # cuando el módulo se importa en lugar de ejecutarse como __main__
+        pickle.dump(vars(grid), f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(cache_path)
+    return grid
+
+
+class Candidatos:
+    """
+    Conjunto de índices con elección aleatoria en O(1): una lista más la
+    posición de cada elemento; al quitar, el último ocupa el hueco (swap-remove).
+    """
+
+    def __init__(self):
+        self.items = []
+        self.pos = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, x):
+        if x not in self.pos:
+            self.pos[x] = len(self.items)
+            self.items.append(x)
+
+    def discard(self, x):
+        k = self.pos.pop(x, None)
+        if k is None:
+            return
+        last = self.items.pop()
+        if k < len(self.items):
+            self.items[k] = last
+            self.pos[last] = k
+
+    def choice(self):
+        return random.choice(self.items)
+
+
+# Coloca el triomino `idx` y actualiza el estado de forma incremental:
+# solo se tocan los triominos que comparten celda con la ficha o con la nueva frontera
+def colocar_ficha(grid, idx, placed, occupied, frontier, live, candidates):
+    piece = grid.triominos[idx]
+    placed.append(piece)
+    occupied.update(piece)
+    for cell in piece:
+        dead = grid.cell_to_triominos[cell]
+        live.difference_update(dead)
+        for i in dead:
+            candidates.discard(i)
+    new_frontier = set()
+    for cell in piece:
+        new_frontier.update(grid.adj[cell])
+    new_frontier -= occupied
+    new_frontier -= frontier
+    frontier -= occupied
+    frontier |= new_frontier
+    # Orden fijo (el hash de las celdas cambia entre procesos): así el orden de
+    # `candidates`, y con él la elección para una semilla dada, es reproducible
+    for cell in sorted(new_frontier):
+        for i in grid.cell_to_triominos[cell]:
+            if i in live:
+                candidates.add(i)
+    return piece
+
+
+def generar(grid, max_fichas):
+    """Llena la grilla con hasta `max_fichas` triominos; devuelve los colocados."""
+    if njit is not None:
+        first = np.array(grid.cell_to_triominos[grid.center], dtype=np.int64)
+        seed = random.randrange(2**32)
+        chosen = _generar_kernel(grid.tri_cells, grid.adj_indptr, grid.adj_indices,
+                                 first, max_fichas, seed)
+        return [grid.triominos[i] for i in chosen]
 
-# Generación de ideogramas (cada generación limpia y vuelve a llenar)
-for gen in range(num_generaciones):
-    print(f"\n===== Generación {gen+1} =====")
     placed = []
     occupied = set()
+    # Frontera: celdas libres vecinas del área ocupada (se actualiza en cada jugada)
+    frontier = set()
+    # Triominos todavía libres y, entre ellos, los que tocan la frontera
+    live = set(range(len(grid.triominos)))
+    candidates = Candidatos()
     # Seleccionar el centro y colocar la primera ficha que contenga dicha celda
-    center = min(cell_ids, key=lambda cid: abs(cid[0]-rows/2) + abs(cid[1]-cols/2))
-    first_candidates = [t for t in triominos if center in t]
+    center = grid.center
+    first_candidates = grid.cell_to_triominos[center]
     if first_candidates:
-        piece = random.choice(first_candidates)
-        placed.append(piece)
-        occupied.update(piece)
+        piece = colocar_ficha(grid, random.choice(first_candidates),
+                              placed, occupied, frontier, live, candidates)
         print(f"Primera ficha colocada (centro {center}): {piece}")
     else:
         print("No se encontró candidato para la ficha inicial.")
-    
+
     loop_iter = 0
     while len(placed) < max_fichas:
         loop_iter += 1
-        candidates = []
-        for t in triominos:
-            if any(cell in occupied for cell in t):
-                continue
-            if occupied and not is_adjacent_to_occupied(t, occupied):
-                continue
-            candidates.append(t)
-        print(f"Iteración {loop_iter} - Candidatos disponibles: {len(candidates)}")
-        if not candidates:
+        # Sin fichas en el tablero, cualquier triomino libre es candidato
+        pool = candidates if occupied else live
+        print(f"Iteración {loop_iter} - Candidatos disponibles: {len(pool)}")
+        if not pool:
             print("No quedan candidatos disponibles en esta generación.")
             break
-        piece = random.choice(candidates)
-        placed.append(piece)
-        occupied.update(piece)
+        # `live` solo hace de pool antes de la primera ficha (una única vez)
+        idx = candidates.choice() if occupied else random.choice(sorted(live))
+        piece = colocar_ficha(grid, idx, placed, occupied, frontier, live, candidates)
         print(f"Ficha colocada: {piece}")
-    
-    print(f"Fichas colocadas en generación {gen+1}: {len(placed)}")
-    
-    # Animar la colocación de fichas en la figura:
-    dibujar_grilla(ax)
-    fig.canvas.draw()
-    fig.canvas.flush_events()
-    plt.pause(0.1)  # Pausa para visualizar la grilla vacía
-    
-    for triomino in placed:
-        for cid in triomino:
-            poly = Polygon(coords_map[cid], facecolor='tomato', edgecolor='black', zorder=2)
-            ax.add_patch(poly)
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        plt.pause(0.0010)  # Pausa breve entre cada ficha
-    
-    # Mantener la visualización por 1 segundo y luego limpiar para la siguiente generación
-    plt.pause(1)
-    
-plt.ioff()
-plt.show()
\ No newline at end of file
+    return placed
+
+
+# Misma generación que `generar`, pero sobre arrays de ids enteros y compilada
+# con Numba: recorre todos los triominos en cada paso sin bytecode de Python.
+# Devuelve los índices (en grid.triominos) de las fichas colocadas, en orden.
+def _generar_kernel(tri_cells, adj_indptr, adj_indices, first_candidates, max_fichas, seed):
+    np.random.seed(seed)
+    n_tri = tri_cells.shape[0]
+    n_cells = adj_indptr.shape[0] - 1
+    occupied = np.zeros(n_cells, dtype=np.uint8)
+    frontier = np.zeros(n_cells, dtype=np.uint8)
+    placed = np.empty(max_fichas, dtype=np.int64)
+    n_placed = 0
+
+    while n_placed < max_fichas:
+        if n_placed == 0 and first_candidates.shape[0] > 0:
+            chosen = first_candidates[np.random.randint(first_candidates.shape[0])]
+        else:
+            # Muestreo de reservorio (k=1): una sola pasada, el i-ésimo candidato
+            # reemplaza al elegido con probabilidad 1/i -> elección uniforme
+            count = 0
+            chosen = -1
+            for i in range(n_tri):
+                a, b, c = tri_cells[i, 0], tri_cells[i, 1], tri_cells[i, 2]
+                if occupied[a] or occupied[b] or occupied[c]:
+                    continue
+                if n_placed > 0 and not (frontier[a] or frontier[b] or frontier[c]):
+                    continue
+                count += 1
+                if np.random.random() * count < 1.0:
+                    chosen = i
+            if count == 0:
+                break
+
+        placed[n_placed] = chosen
+        n_placed += 1
+        for j in range(3):
+            cell = tri_cells[chosen, j]
+            occupied[cell] = 1
+            frontier[cell] = 0
+        for j in range(3):
+            cell = tri_cells[chosen, j]
+            for k in range(adj_indptr[cell], adj_indptr[cell + 1]):
+                n = adj_indices[k]
+                if not occupied[n]:
+                    frontier[n] = 1
+
+    return placed[:n_placed]
+
+
+if njit is not None:
+    _generar_kernel = njit(cache=True)(_generar_kernel)
+
+
+class Animacion:
+    """
+    Figura con todos los triángulos en dos colecciones (una sola pieza cada una):
+    la grilla de fondo y las fichas, cuyos colores se actualizan por celda.
+    """
+    FICHA_FACE = to_rgba('tomato')
+    FICHA_EDGE = to_rgba('black')
+
+    def __init__(self, grid):
+        self.fig, self.ax = plt.subplots(figsize=(10, 10))
+        self.cell_index = {cid: k for k, cid in enumerate(grid.cell_ids)}
+        polys = [grid.coords_map[cid] for cid in grid.cell_ids]
+        self.face_colors = np.zeros((len(polys), 4))
+        self.edge_colors = np.zeros((len(polys), 4))
+
+        grid_coll = PolyCollection(polys, facecolors='none', edgecolors='darkgray',
+                                   linewidths=0.5, zorder=1)
+        self.fichas_coll = PolyCollection(polys, facecolors=self.face_colors,
+                                          edgecolors=self.edge_colors, zorder=2)
+        self.ax.add_collection(grid_coll)
+        self.ax.add_collection(self.fichas_coll)
+        self.ax.set_aspect('equal')
+        self.ax.autoscale_view()
+        self.ax.axis('off')
+        plt.tight_layout()
+
+    # Deja la grilla vacía (todas las fichas transparentes)
+    def dibujar_grilla(self):
+        self.face_colors[:] = 0
+        self.edge_colors[:] = 0
+        self.fichas_coll.set_facecolors(self.face_colors)
+        self.fichas_coll.set_edgecolors(self.edge_colors)
+
+    # Pinta las celdas de un triomino (solo actualiza los colores, sin dibujar)
+    def dibujar_ficha(self, triomino):
+        idxs = [self.cell_index[cid] for cid in triomino]
+        self.face_colors[idxs] = self.FICHA_FACE
+        self.edge_colors[idxs] = self.FICHA_EDGE
+
+    # Redibuja solo la colección de fichas y la vuelca a pantalla con blit
+    def mostrar(self):
+        self.fichas_coll.set_facecolors(self.face_colors)
+        self.fichas_coll.set_edgecolors(self.edge_colors)
+        self.ax.draw_artist(self.fichas_coll)
+        self.fig.canvas.blit(self.ax.bbox)
+        self.fig.canvas.flush_events()
+
+
+# Render offscreen de una generación a PNG: Figure sin pyplot usa el canvas
+# Agg, así que los procesos worker nunca tocan el backend de la GUI
+def renderizar_png(grid, placed, dpi=80):
+    fig = Figure(figsize=(10, 10))
+    ax = fig.add_subplot()
+    polys = [grid.coords_map[cid] for cid in grid.cell_ids]
+    ax.add_collection(PolyCollection(polys, facecolors='none', edgecolors='darkgray',
+                                     linewidths=0.5, zorder=1))
+    cells = [cid for triomino in placed for cid in triomino]
+    ax.add_collection(PolyCollection([grid.coords_map[cid] for cid in cells],
+                                     facecolors='tomato', edgecolors='black', zorder=2))
+    ax.set_aspect('equal')
+    ax.autoscale_view()
+    ax.axis('off')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi)
+    return buf.getvalue()
+
+
+# Estado de cada proceso worker: la grilla se envía una sola vez al crearlo
+_worker_grid = None
+
+def _init_worker(grid):
+    global _worker_grid
+    _worker_grid = grid
+
+# Cada generación es independiente: se simula (y opcionalmente se renderiza) en un worker
+def simular_generacion(args):
+    seed, max_fichas, con_png = args
+    random.seed(seed)
+    placed = generar(_worker_grid, max_fichas)
+    png = renderizar_png(_worker_grid, placed) if con_png else None
+    return placed, png
+
+
+if __name__ == "__main__":
+    # 1) Parámetros de la grilla
+    rows, cols = 15, 15
+    side = 1
+    grid = load_grid(rows, cols, side)
+
+    # Parámetros para la animación de generaciones:
+    max_fichas = 56      # Fichas por generación
+    num_generaciones = 5 # Número de iteraciones de llenado
+    batch_size = 10      # Fichas pintadas entre cada refresco de pantalla
+    delay_ficha = 0.0010 # Pausa por ficha (se acumula por lote)
+    guardar_en = None    # Carpeta para guardar un PNG por generación (None = no guardar)
+
+    # Simular todas las generaciones en paralelo antes de animarlas
+    seeds = [random.randrange(2**32) for _ in range(num_generaciones)]
+    tareas = [(seed, max_fichas, guardar_en is not None) for seed in seeds]
+    with mp.Pool(min(num_generaciones, mp.cpu_count()),
+                 initializer=_init_worker, initargs=(grid,)) as pool:
+        resultados = pool.map(simular_generacion, tareas)
+
+    if guardar_en is not None:
+        out_dir = Path(guardar_en)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for gen, (_, png) in enumerate(resultados):
+            (out_dir / f"generacion_{gen+1}.png").write_bytes(png)
+
+    # Preparamos la figura y eje una sola vez
+    plt.ion()  # Modo interactivo
+    anim = Animacion(grid)
+
+    # Generación de ideogramas (cada generación limpia y vuelve a llenar)
+    for gen, (placed, _) in enumerate(resultados):
+        print(f"\n===== Generación {gen+1} =====")
+        print(f"Fichas colocadas en generación {gen+1}: {len(placed)}")
+
+        # Animar la colocación de fichas en la figura:
+        anim.dibujar_grilla()
+        anim.fig.canvas.draw()
+        anim.fig.canvas.flush_events()
+        plt.pause(0.1)  # Pausa para visualizar la grilla vacía
+
+        # Se refresca la pantalla una vez por lote, no por ficha: plt.pause
+        # reentra al event loop y recompone la figura completa en cada llamada
+        for k, triomino in enumerate(placed, 1):
+            anim.dibujar_ficha(triomino)
+            if k % batch_size == 0 or k == len(placed):
+                anim.mostrar()
+                # Espera atendiendo el event loop (sin redibujar): la ventana
+                # sigue respondiendo entre lotes
+                anim.fig.canvas.start_event_loop(delay_ficha * batch_size)
+
+        # Mantener la visualización por 1 segundo y luego limpiar para la siguiente generación
+        plt.pause(1)
+
+    plt.ioff()
+    plt.show()
@@ -1,10 +1,31 @@
 import unittest
 
+import numpy as np
+
+from src.ai.strategies import (GreedyStrategy, MinimaxStrategy, RLStrategy, ScoredMove,
+                               get_strategy)
 from src.engine.game import TriominoGame
-from src.models.board import ValidPlacement
+from src.models.board import GameBoard, ValidPlacement
+from src.models.deck import create_full_deck
 from src.engine.rules import calculate_draw_failure_penalty, calculate_pass_penalty
 
 
+class _LastLegalModel:
+    """Stand-in for MaskablePPO: picks the last legal action of each mask."""
+
+    def predict(self, obs, deterministic=True, action_masks=None):
+        masks = np.asarray(action_masks)
+        if masks.ndim == 1:
+            return int(np.flatnonzero(masks)[-1]), None
+        return np.array([np.flatnonzero(m)[-1] for m in masks]), None
+
+
+def _rl_strategy() -> RLStrategy:
+    strat = RLStrategy()
+    strat.model = _LastLegalModel()
+    return strat
+
+
 class TestEngineBehavior(unittest.TestCase):
     def test_execute_place_invalid_does_not_remove_tile(self):
         game = TriominoGame(player_names=["A", "B"], seed=1)
@@ -41,5 +62,278 @@ class TestEngineBehavior(unittest.TestCase):
         self.assertEqual(event.points, -10)
 
 
+
+class _OrderedGreedy(GreedyStrategy):
+    """Greedy that breaks ties by hand order, position and rotation.
+
+    GreedyStrategy keeps the first best placement it finds, and placements
+    come out in the board's set order, which follows the hash seed.
+    """
+
+    def choose_move(self, player, board):
+        moves = [(-(tile.sum_value + p.bonus_points), i, p.position, p.rotation)
+                 for i, tile in enumerate(player.hand)
+                 for p in board.find_valid_placements(tile)]
+        if not moves:
+            return None
+        _, i, position, rotation = min(moves)
+        tile = player.hand[i]
+        placement = next(p for p in board.find_valid_placements(tile)
+                         if p.position == position and p.rotation == rotation)
+        return ScoredMove(tile=tile, placement=placement,
+                          base_score=tile.sum_value, bonus_score=placement.bonus_points)
+
+
+def _plain_negamax(strat, board, hands, side, depth):
+    """Unpruned negamax with the same evaluation as MinimaxStrategy."""
+    next_side = (side + 1) % len(hands)
+    moves = strat._ordered_moves(board, hands[side])
+    if not moves:
+        if depth <= 1:
+            return strat.PASS_PENALTY
+        return strat.PASS_PENALTY - _plain_negamax(strat, board, hands, next_side, depth - 1)
+    best = float("-inf")
+    for points, tile, placement in moves:
+        rest = [t for t in hands[side] if t is not tile]
+        if not rest:
+            others = sum(t.sum_value for i, h in enumerate(hands) if i != side for t in h)
+            value = points + strat.ROUND_WIN_BONUS + others
+        elif depth <= 1:
+            value = points
+        else:
+            child = board.copy()
+            child.place_tile(tile, placement.row, placement.col,
+                             placement.orientation, placement.rotation)
+            next_hands = list(hands)
+            next_hands[side] = rest
+            value = points - _plain_negamax(strat, child, next_hands, next_side, depth - 1)
+        best = max(best, value)
+    return best
+
+
+class TestMinimaxStrategy(unittest.TestCase):
+    def _started_game(self, seed):
+        game = TriominoGame(player_names=["A", "B"], seed=seed,
+                            strategies=[_OrderedGreedy(), _OrderedGreedy()])
+        game.setup_round()
+        game.play_opening()
+        game.next_player()
+        return game
+
+    def _contested_position(self, seed):
+        """Play greedily until both players have a few moves to choose from."""
+        game = self._started_game(seed)
+        probe = MinimaxStrategy()
+        for _ in range(30):
+            counts = [len(probe._ordered_moves(game.board, p.hand)) for p in game.players]
+            if min(counts) >= 3:
+                return game
+            game.play_turn()
+            self.assertIsNone(game.check_round_end())
+            game.next_player()
+        self.fail(f"no contested position for seed {seed}")
+
+    def test_depth_one_matches_greedy(self):
+        minimax = MinimaxStrategy(depth=1)
+        greedy = GreedyStrategy()
+        game = self._started_game(4)
+        minimax.set_game(game)
+        compared = 0
+        for _ in range(20):
+            player = game.current_player
+            # With one tile left the round-win bonus makes the values differ
+            if player.hand_size > 1:
+                expected = greedy.choose_move(player, game.board)
+                move = minimax.choose_move(player, game.board)
+                self.assertEqual((move.tile, move.placement) if move else None,
+                                 (expected.tile, expected.placement) if expected else None)
+                compared += expected is not None
+            game.play_turn()
+            if game.check_round_end() is not None:
+                break
+            game.next_player()
+        self.assertGreater(compared, 0)
+
+    def test_alphabeta_matches_plain_minimax(self):
+        inf = float("inf")
+        for seed in (2, 4, 5, 6, 7, 9, 10):
+            game = self._contested_position(seed)
+            hands = [list(p.hand) for p in game.players]
+            for side in range(len(hands)):
+                strat = MinimaxStrategy(depth=4)
+                strat.set_game(game)
+                strat._root_hands = tuple(tuple(sorted(t.canonical_id for t in h))
+                                          for h in hands)
+                with self.subTest(seed=seed, side=side):
+                    expected = _plain_negamax(strat, game.board, hands, side, 4)
+                    for depth in (2, 3):
+                        # Shallower searches first fill the transposition table
+                        # and move ordering that the deeper ones then rely on
+                        strat._negamax(game.board, hands, side, depth, -inf, inf)
+                    # Null windows either side of the value must fail soft on
+                    # the right side, and leave only bounds in the table
+                    low = strat._negamax(game.board, hands, side, 4, expected - 1, expected)
+                    self.assertGreaterEqual(low, expected)
+                    high = strat._negamax(game.board, hands, side, 4, expected, expected + 1)
+                    self.assertLessEqual(high, expected)
+                    value = strat._negamax(game.board, hands, side, 4, -inf, inf)
+                    self.assertEqual(value, expected)
+                    # Loose but true bounds in the table narrow the window and
+                    # must never be returned as the value itself
+                    key = (game.board.zobrist_hash(), side, strat._root_hands)
+                    for flag, bound in ((strat.LOWER, expected - 50),
+                                        (strat.UPPER, expected + 50)):
+                        strat.tt[key] = (4, bound, flag, None)
+                        value = strat._negamax(game.board, hands, side, 4, -inf, inf)
+                        self.assertEqual(value, expected)
+
+    def test_set_game_clears_search_tables(self):
+        strat = MinimaxStrategy(depth=2)
+        game = self._contested_position(2)
+        strat.set_game(game)
+        strat.choose_move(game.current_player, game.board)
+        strat.killers[1] = (("killer",),)
+        strat.history[("move",)] = 4
+        self.assertTrue(strat.tt)
+
+        strat.set_game(game)
+        self.assertTrue(strat.tt and strat.killers and strat.history)
+
+        strat.set_game(TriominoGame(player_names=["A", "B"], seed=3))
+        self.assertEqual((strat.tt, strat.killers, strat.history), ({}, {}, {}))
+
+
+def _placements(placements):
+    return sorted((p.position, p.rotation, p.edges_matched, p.bridge_count, p.hexagon_count)
+                  for p in placements)
+
+
+def _unfiltered_search(board, tile):
+    """Placement search with both edge-bitboard prefilters disabled."""
+    tile = tile.copy(tile.rotation)
+    tile.edge_mask = (1 << 36) - 1
+    return board._search_placements(tile)
+
+
+class TestBoardCaches(unittest.TestCase):
+    def _check_board(self, board, tiles):
+        for tile in tiles:
+            cached = _placements(board.find_valid_placements(tile))
+            self.assertEqual(cached, _placements(board._search_placements(tile)))
+            self.assertEqual(cached, _placements(_unfiltered_search(board, tile)))
+
+    def test_cached_placements_match_fresh_search(self):
+        tiles = create_full_deck()
+        for seed in (1, 2):
+            game = TriominoGame(player_names=["A", "B"], seed=seed)
+            game.setup_round()
+            game.play_opening()
+            for _ in range(25):
+                game.next_player()
+                version = game.board.version
+                game.play_turn()
+                if game.board.version != version:
+                    self._check_board(game.board, tiles)
+                for player in game.players:
+                    # can_player_move keeps its own cache per seat and hand
+                    expected = any(game.board._search_placements(t) for t in player.hand)
+                    self.assertEqual(game.can_player_move(player), expected)
+                if game.check_round_end() is not None:
+                    break
+
+    def test_can_player_move_sees_hand_changes(self):
+        game = TriominoGame(player_names=["A", "B"], seed=1)
+        game.setup_round()
+        game.play_opening()
+        player = game.players[0]
+        playable = [t for t in create_full_deck() if game.board.find_valid_placements(t)]
+        version = game.board.version
+
+        player.reset_for_new_round()
+        self.assertFalse(game.can_player_move(player))
+        player.add_tiles(playable[:1])
+        self.assertTrue(game.can_player_move(player))
+        player.play_tile(playable[0])
+        self.assertFalse(game.can_player_move(player))
+        self.assertEqual(game.board.version, version)
+
+    def test_can_player_move_sees_new_board(self):
+        game = TriominoGame(player_names=["A", "B"], seed=1)
+        game.setup_round()
+        game.play_opening()
+        player = game.players[0]
+        tiles = create_full_deck()
+        tile = next(t for t in tiles if game.board.find_valid_placements(t))
+        player.reset_for_new_round()
+        player.add_tiles([tile])
+        self.assertTrue(game.can_player_move(player))
+
+        # A new round's board can reach the same version as the old one
+        for first in tiles:
+            board = GameBoard()
+            board.place_first_tile(first)
+            if not board.find_valid_placements(tile):
+                break
+        self.assertEqual(board.version, game.board.version)
+        game.board = board
+        self.assertFalse(game.can_player_move(player))
+
+    def test_copy_does_not_share_placement_cache(self):
+        tiles = create_full_deck()
+        game = TriominoGame(player_names=["A", "B"], seed=1)
+        game.setup_round()
+        game.play_opening()
+        board = game.board
+        self._check_board(board, tiles)
+        before = {t.base_values: _placements(board.find_valid_placements(t)) for t in tiles}
+
+        child = board.copy()
+        self.assertIsNot(child._placement_cache, board._placement_cache)
+        tile = next(t for t in tiles if child.find_valid_placements(t))
+        placement = child.find_valid_placements(tile)[0]
+        child.place_tile(tile, placement.row, placement.col,
+                         placement.orientation, placement.rotation)
+        self._check_board(child, tiles)
+
+        after = {t.base_values: _placements(board.find_valid_placements(t)) for t in tiles}
+        self.assertEqual(after, before)
+        self._check_board(board, tiles)
+
+
+class TestRLBatch(unittest.TestCase):
+    def _moves(self, moves):
+        return [(m.tile, m.placement) if m else None for m in moves]
+
+    def test_batch_matches_one_by_one(self):
+        strategies, players = [], []
+        for seed in (1, 2):
+            strat = _rl_strategy()
+            game = TriominoGame(player_names=["A", "B"], seed=seed,
+                                strategies=[strat, get_strategy("greedy")])
+            game.setup_round()
+            game.play_opening()
+            strategies.append(strat)
+            players.append(game.players[0])
+
+        expected = [s.choose_move(p, s.game.board) for s, p in zip(strategies, players)]
+        batch = RLStrategy.choose_moves_batch(strategies, players)
+
+        self.assertTrue(any(expected))
+        self.assertEqual(self._moves(batch), self._moves(expected))
+
+    def test_batch_with_repeated_instance(self):
+        strat = _rl_strategy()
+        game = TriominoGame(player_names=["A", "B"], seed=3, strategies=[strat, strat])
+        game.setup_round()
+        game.play_opening()
+        players = list(game.players)
+
+        expected = [strat.choose_move(p, game.board) for p in players]
+        batch = RLStrategy.choose_moves_batch([strat, strat], players)
+
+        self.assertTrue(any(expected))
+        self.assertEqual(self._moves(batch), self._moves(expected))
+
+
 if __name__ == "__main__":
     unittest.main()